@@ -28,6 +28,7 @@ __version__ = '0.1.12'
 from .chips.etroc2_chip import ETROC2_Chip
 from .functions import addLoggingLevel
 from .i2c_messages import I2CMessages
+from .i2c_usb_iss_helper import AsyncUSB_ISS_Helper
 from .i2c_usb_iss_helper import USB_ISS_Helper
 
 # Add custom log levels to logging
@@ -35,4 +36,4 @@ addLoggingLevel('TRACE', 8)
 addLoggingLevel('DETAILED_TRACE', 5)
 # addLoggingLevel('HIGH_TEST', 100)
 
-__all__ = ["I2CMessages", "USB_ISS_Helper", "ETROC2_Chip"]
+__all__ = ["I2CMessages", "USB_ISS_Helper", "AsyncUSB_ISS_Helper", "ETROC2_Chip"]
@@ -256,7 +256,11 @@ class Address_Space_Controller:
             return False
 
         self._logger.info(
-            f"Reading a block of {word_count} words ({self._bytes_per_word} bytes each) starting at address {base_address} in the address space '{self._name}'"
+            "Reading a block of %s words (%s bytes each) starting at address %s in the address space '%s'",
+            word_count,
+            self._bytes_per_word,
+            base_address,
+            self._name,
         )
 
         tmp = self._i2c_connection.read_device_memory(
@@ -289,11 +293,17 @@ class Address_Space_Controller:
                 break
         if has_read_only:
             self._logger.info(
-                f"The block of {word_count} words starting at address {base_address} in the address space '{self._name}' covers one or more words which are read only, it will be broken down into smaller blocks which do not cover the read only words"
+                "The block of %s words starting at address %s in the address space '%s' covers one or more words which are read only,"
+                " it will be broken down into smaller blocks which do not cover the read only words",
+                word_count,
+                base_address,
+                self._name,
             )
             return self.write_memory_block_with_split_for_read_only(base_address, word_count, readback_check, readback_base_address)
 
-        self._logger.info(f"Writing a block of {word_count} words starting at address {base_address} in the address space '{self._name}'")
+        self._logger.info(
+            "Writing a block of %s words starting at address %s in the address space '%s'", word_count, base_address, self._name
+        )
 
         self._i2c_connection.write_device_memory(
             self._i2c_address,
@@ -363,7 +373,7 @@ class Address_Space_Controller:
             ranges += [(start_address, base_address + idx - start_address + 1, start_address - base_address + readback_base_address)]
 
         success = True
-        self._logger.info(f"Found {len(ranges)} ranges without read only registers")
+        self._logger.info("Found %d ranges without read only registers", len(ranges))
         for range_param in ranges:
             if not self.write_memory_block(range_param[0], range_param[1], readback_check, range_param[2]):
                 success = False
@@ -375,7 +385,7 @@ class Address_Space_Controller:
             self._logger.error(f"Unable to read address space '{self._name}' because the i2c address is not set")
             return
 
-        self._logger.info(f"Reading the full '{self._name}' address space")
+        self._logger.info("Reading the full '%s' address space", self._name)
 
         if self.read_memory_block(0, self._address_space_size):
             self._not_read = False
@@ -386,17 +396,17 @@ class Address_Space_Controller:
             return
 
         block = self._blocks[block_name]
-        self._logger.info("Attempting to read block {}".format(block_name))
+        self._logger.info("Attempting to read block %s", block_name)
 
         self.read_memory_block(block["Base Address"], block["Length"])
 
     def read_register(self, block_name, register_name):
-        self._logger.detailed_trace(f'Address_Space_Controller::read_register("{block_name}", "{register_name}")')
+        self._logger.detailed_trace('Address_Space_Controller::read_register("%s", "%s")', block_name, register_name)
         if self._i2c_address is None:
             self._logger.error(f"Unable to read address space '{self._name}' because the i2c address is not set")
             return
 
-        self._logger.info(f"Attempting to read register {register_name} in block {block_name}")
+        self._logger.info("Attempting to read register %s in block %s", register_name, block_name)
 
         self.read_memory_block(self._register_map[block_name + "/" + register_name], 1)
 
@@ -407,11 +417,12 @@ class Address_Space_Controller:
 
         if self._has_readonly:
             self._logger.info(
-                f"Unable to write the full '{self._name}' address space because there are some read only registers, breaking it into smaller blocks"
+                "Unable to write the full '%s' address space because there are some read only registers, breaking it into smaller blocks",
+                self._name,
             )
             return self.write_memory_block_with_split_for_read_only(0, self._address_space_size, readback_check)
 
-        self._logger.info("Writing the full '{}' address space".format(self._name))
+        self._logger.info("Writing the full '%s' address space", self._name)
         return self.write_memory_block(0, self._address_space_size, readback_check)
 
     def write_block(self, block_name, readback_check: bool = True):
@@ -420,7 +431,7 @@ class Address_Space_Controller:
             return False
 
         block = self._blocks[block_name]
-        self._logger.info("Attempting to write block {}".format(block_name))
+        self._logger.info("Attempting to write block %s", block_name)
 
         base_address = block["Base Address"]
         original_base_address = base_address
@@ -430,12 +441,12 @@ class Address_Space_Controller:
         return self.write_memory_block(base_address, block["Length"], readback_check, original_base_address)
 
     def write_register(self, block_name, register_name, readback_check: bool = True):
-        self._logger.detailed_trace(f'Address_Space_Controller::write_register("{block_name}", "{register_name}", {readback_check})')
+        self._logger.detailed_trace('Address_Space_Controller::write_register("%s", "%s", %s)', block_name, register_name, readback_check)
         if self._i2c_address is None:
             self._logger.error(f"Unable to write address space '{self._name}' because the i2c address is not set")
             return False
 
-        self._logger.info("Attempting to write register {} in block {}".format(register_name, block_name))
+        self._logger.info("Attempting to write register %s in block %s", register_name, block_name)
 
         address = self._register_map[block_name + "/" + register_name]
         original_address = address
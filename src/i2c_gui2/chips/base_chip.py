@@ -281,13 +281,13 @@ class Base_Chip:
 
     def read_all_address_space(self, address_space_name: str, no_message: bool = True):
         if not no_message:
-            self._logger.info("Reading full address space: {}".format(address_space_name))
+            self._logger.info("Reading full address space: %s", address_space_name)
         address_space: Address_Space_Controller = self._address_space[address_space_name]
         address_space.read_all()
 
     def write_all_address_space(self, address_space_name: str, readback_check: bool = True, no_message: bool = True):
         if not no_message:
-            self._logger.info("Writing full address space: {}".format(address_space_name))
+            self._logger.info("Writing full address space: %s", address_space_name)
         address_space: Address_Space_Controller = self._address_space[address_space_name]
         return address_space.write_all(readback_check=readback_check)
 
@@ -299,7 +299,7 @@ class Base_Chip:
         )
 
         if not no_message:
-            self._logger.info(f"Reading block {block_ref} from address space {address_space_name} of chip {self._chip_name}")
+            self._logger.info("Reading block %s from address space %s of chip %s", block_ref, address_space_name, self._chip_name)
         address_space: Address_Space_Controller = self._address_space[address_space_name]
         address_space.read_block(block_ref)
 
@@ -313,12 +313,12 @@ class Base_Chip:
         )
 
         if not no_message:
-            self._logger.info(f"Writing block {block_ref} from address space {address_space_name} of chip {self._chip_name}")
+            self._logger.info("Writing block %s from address space %s of chip %s", block_ref, address_space_name, self._chip_name)
         address_space: Address_Space_Controller = self._address_space[address_space_name]
         return address_space.write_block(block_ref, readback_check=readback_check)
 
     def read_register(self, address_space_name: str, block_name: str, register: str, no_message: bool = True):
-        self._logger.detailed_trace(f'Base_Chip::read_register("{address_space_name}", "{block_name}", "{register}", {no_message})')
+        self._logger.detailed_trace('Base_Chip::read_register("%s", "%s", "%s", %s)', address_space_name, block_name, register, no_message)
         block_ref, _ = self._gen_block_ref_from_indexers(
             address_space_name=address_space_name,
             block_name=block_name,
@@ -328,16 +328,14 @@ class Base_Chip:
 
         if not no_message:
             self._logger.info(
-                "Reading register {} from block {} of address space {} of chip {}".format(
-                    register, block_ref, address_space_name, self._chip_name
-                )
+                "Reading register %s from block %s of address space %s of chip %s", register, block_ref, address_space_name, self._chip_name
             )
         address_space: Address_Space_Controller = self._address_space[address_space_name]
         address_space.read_register(block_ref, register)
 
     def write_register(self, address_space_name: str, block_name: str, register: str, readback_check: bool = True, no_message: bool = True):
         self._logger.detailed_trace(
-            f'Base_Chip::write_register("{address_space_name}", "{block_name}", "{register}", "{readback_check}", {no_message})'
+            'Base_Chip::write_register("%s", "%s", "%s", "%s", %s)', address_space_name, block_name, register, readback_check, no_message
         )
         block_ref, _ = self._gen_block_ref_from_indexers(
             address_space_name=address_space_name,
@@ -347,9 +345,7 @@ class Base_Chip:
 
         if not no_message:
             self._logger.info(
-                "Writing register {} from block {} of address space {} of chip {}".format(
-                    register, block_ref, address_space_name, self._chip_name
-                )
+                "Writing register %s from block %s of address space %s of chip %s", register, block_ref, address_space_name, self._chip_name
             )
         address_space: Address_Space_Controller = self._address_space[address_space_name]
         return address_space.write_register(block_ref, register, readback_check=readback_check)
@@ -371,7 +367,7 @@ class Base_Chip:
             self.write_register(address_space_name, block_name, register, write_check, no_message=no_message)
 
     def get_decoded_value(self, address_space_name: str, block_name: str, decoded_value_name: str):
-        self._logger.detailed_trace(f'Base_Chip::get_decoded_value("{address_space_name}", "{block_name}", "{decoded_value_name}")')
+        self._logger.detailed_trace('Base_Chip::get_decoded_value("%s", "%s", "%s")', address_space_name, block_name, decoded_value_name)
         value_info = self._register_decoding[address_space_name]['Register Blocks'][block_name][decoded_value_name]
 
         value = 0
@@ -400,7 +396,7 @@ class Base_Chip:
         return value
 
     def set_decoded_value(self, address_space_name: str, block_name: str, decoded_value_name: str, value: int):
-        self._logger.detailed_trace(f'Base_Chip::set_decoded_value("{address_space_name}", "{block_name}", "{decoded_value_name}")')
+        self._logger.detailed_trace('Base_Chip::set_decoded_value("%s", "%s", "%s")', address_space_name, block_name, decoded_value_name)
         value_info = self._register_decoding[address_space_name]['Register Blocks'][block_name][decoded_value_name]
 
         bit_length = value_info['bits']
@@ -25,6 +25,14 @@ from __future__ import annotations
 
 import logging
 import re
+import struct
+from functools import lru_cache
+
+# struct format characters for the word lengths with a native C type
+_STRUCT_FORMATS = {2: 'H', 4: 'I', 8: 'Q'}
+
+_U32_BE = struct.Struct('>I')
+_U32_LE = struct.Struct('<I')
 
 
 def is_valid_hostname(hostname: str):
@@ -121,84 +129,110 @@ def addLoggingLevel(levelName, levelNum, methodName=None):
 
 
 def swap_endian_16bit(value: int):
-    value = value & 0xFFFF  # Limit value to 16 bits
+    # Only the lower 16 bits are kept by the masks, so the value is limited to 16 bits
+    return ((value & 0xFF) << 8) | ((value >> 8) & 0xFF)
 
-    value_swapped = (value >> 8) | ((value & 0xFF) << 8)
 
-    return value_swapped
+def swap_endian_32bit(value: int):
+    return _U32_LE.unpack(_U32_BE.pack(value & 0xFFFFFFFF))[0]  # Limit value to 32 bits before swapping
 
 
-def swap_endian_32bit(value: int):
-    value = value & 0xFFFFFFFF  # Limit value to 32 bits
+def valid_i2c_address(value: int):
+    # A single mask test covers both the upper bound and negative values
+    return type(value) is int and (value & ~0x7F) == 0
 
-    value_swapped = (value >> 24) | ((value & 0xFF0000) >> 8) | ((value & 0xFF00) << 8) | ((value & 0xFF) << 24)
 
-    return value_swapped
+def _identity(value: int):
+    return value
 
 
-def valid_i2c_address(value: int):
-    if not isinstance(value, int):
-        return False
+# Address encoders for the little endian addresses which require a byte swap
+_ADDR_ENCODERS = {
+    16: swap_endian_16bit,
+    32: swap_endian_32bit,
+}
 
-    if value > 127 or value < 0:
-        return False
 
-    return True
+def get_address_encoder(bitlength: int = 8, endianness: str = 'big'):
+    if endianness != 'little' or bitlength == 8:
+        return _identity
+
+    encoder = _ADDR_ENCODERS.get(bitlength)
+    if encoder is None:
+        raise RuntimeError(f"Endian swap not implemented for bit length {bitlength}")
+    return encoder
 
 
 def address_to_phys(address: int, bitlength: int = 8, endianness: str = 'big'):
-    if endianness == 'little':
-        if bitlength == 8:
-            pass
-        elif bitlength == 16:
-            address = swap_endian_16bit(address)
-        elif bitlength == 32:
-            address = swap_endian_32bit(address)
-        else:
-            raise RuntimeError(f"Endian swap not implemented for bit length {bitlength}")
+    # Big endian and 8-bit addresses are by far the most common, so skip the encoder lookup for them
+    if bitlength == 8 or endianness != 'little':
+        return address
+
+    return get_address_encoder(bitlength, endianness)(address)
 
-    return address
+
+@lru_cache(maxsize=128)
+def _get_struct(bytelength: int, endianness: str, count: int) -> struct.Struct:
+    endian_char = '>' if endianness == 'big' else '<'
+    return struct.Struct(f"{endian_char}{count}{_STRUCT_FORMATS[bytelength]}")
+
+
+@lru_cache(maxsize=32)
+def _make_unpack(bytelength: int, endianness: str):
+    # Generate a function with the word assembly unrolled for this word length, for the word lengths
+    # which are not covered by struct
+    if endianness == 'big':
+        shifts = [(bytelength - 1 - byte_offset) * 8 for byte_offset in range(bytelength)]
+    else:
+        shifts = [byte_offset * 8 for byte_offset in range(bytelength)]
+    word_expression = " | ".join(f"(buffer[idx + {byte_offset}] << {shift})" for byte_offset, shift in enumerate(shifts))
+    source = f"def unpack(buffer):\n    return [{word_expression} for idx in range(0, len(buffer), {bytelength})]\n"
+
+    namespace = {}
+    exec(compile(source, f"<unpack_{bytelength}_{endianness}>", "exec"), namespace)
+    return namespace["unpack"]
 
 
 def word_list_to_bytes(word_list: list[int], bytelength: int = 1, endianness: str = 'big'):
     if bytelength == 1:
         byte_list = word_list
     else:
-        byte_list = []
-        if endianness == 'big':
-            for word in word_list:
-                for byte_offset in range(bytelength):
-                    byte_list += [(word >> ((bytelength - 1 - byte_offset) * 8)) & 0xFF]
-        else:  # if endianness == 'little':
-            for word in word_list:
-                for byte_offset in range(bytelength):
-                    byte_list += [(word >> (byte_offset * 8)) & 0xFF]
+        # Mask each word so that values larger than the word length are truncated
+        mask = (1 << (bytelength * 8)) - 1
+        if bytelength in _STRUCT_FORMATS:
+            codec = _get_struct(bytelength, endianness, len(word_list))
+            byte_list = list(codec.pack(*[word & mask for word in word_list]))
+        else:
+            byte_list = list(b''.join((word & mask).to_bytes(bytelength, endianness) for word in word_list))
 
     return byte_list
 
 
 def bytes_to_word_list(byte_list: list[int], bytelength: int = 1, endianness: str = 'big'):
     if bytelength == 1:
-        word_list = byte_list
+        word_list = list(byte_list)
     else:
-        word_list = []
-        word_count = int(len(byte_list) / bytelength)
-        # Do the if outside the for loops, in this way there is a single if evaluation,
-        # instead of multiple if evaluations for each iteration
-        if endianness == 'big':
-            for word_idx in range(word_count):
-                word = 0
-                byte_base_idx = word_idx * bytelength
-                for byte_offset in range(bytelength):
-                    byte_idx = byte_base_idx + byte_offset
-                    word += byte_list[byte_idx] << ((bytelength - 1 - byte_offset) * 8)
-                word_list += [word]
-        else:  # if endianness == 'little':
-            for word_idx in range(word_count):
-                word = 0
-                byte_base_idx = word_idx * bytelength
-                for byte_offset in range(bytelength):
-                    byte_idx = byte_base_idx + byte_offset
-                    word += byte_list[byte_idx] << (byte_offset * 8)
-                word_list += [word]
+        buffer = byte_list if isinstance(byte_list, (bytes, bytearray)) else bytes(byte_list)
+        if len(buffer) % bytelength != 0:
+            raise RuntimeError(f"The number of bytes ({len(buffer)}) is not a multiple of the word length ({bytelength})")
+
+        if bytelength in _STRUCT_FORMATS:
+            word_list = list(_get_struct(bytelength, endianness, len(buffer) // bytelength).unpack_from(buffer))
+        else:
+            word_list = _make_unpack(bytelength, endianness)(buffer)
     return word_list
+
+
+__all__ = [
+    "is_valid_hostname",
+    "is_valid_ip",
+    "validate_hostname",
+    "addLoggingLevel",
+    "swap_endian_16bit",
+    "swap_endian_32bit",
+    "valid_i2c_address",
+    "get_address_encoder",
+    "address_to_phys",
+    "word_list_to_bytes",
+    "bytes_to_word_list",
+]
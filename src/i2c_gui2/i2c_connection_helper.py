@@ -30,20 +30,76 @@ derived classes which implement I2C communication should inherit from.
 from __future__ import annotations
 
 import logging
-from math import ceil
-from math import floor
+from functools import lru_cache
 from time import sleep
 from time import time_ns
+from typing import Union
 
 from .functions import address_to_phys
 from .functions import bytes_to_word_list
+from .functions import get_address_encoder
 from .functions import valid_i2c_address
 from .functions import word_list_to_bytes
 from .i2c_messages import I2CMessages
 
-valid_endianness = ['little', 'big']
-valid_read_type = ['Normal', 'Repeated Start']
-valid_write_type = ['Normal']
+valid_endianness = frozenset(('little', 'big'))
+valid_read_type = frozenset(('Normal', 'Repeated Start'))
+valid_write_type = frozenset(('Normal',))
+valid_return_type = frozenset(('list', 'bytes'))
+
+# Dummy byte sequence returned by block reads in software emulation (no connect) mode
+_DUMMY_BYTES = bytes(range(256))
+
+
+def _block_descriptors(word_address: int, word_count: int, words_per_call: int, encode_address) -> list[tuple[int, int, int, int]]:
+    """Split a block transfer into the individual I2C transfers
+
+    Returns
+    -------
+    list[tuple[int, int, int, int]]
+        For each transfer, the offset of its first word, its word address, its word address as sent on the
+        I2C bus and its number of words.
+    """
+    return [
+        (word_offset, word_address + word_offset, encode_address(word_address + word_offset), min(words_per_call, word_count - word_offset))
+        for word_offset in range(0, word_count, words_per_call)
+    ]
+
+
+# Index n holds the I2C message which reads n bytes
+_READ_COMMANDS = (None,) + tuple(getattr(I2CMessages, f"READ{n}") for n in range(1, 17))
+
+
+@lru_cache(maxsize=4096)
+def _read_block_commands(device_address: int, word_address: int, byte_count: int, address_bitlength: int) -> tuple:
+    """Build the direct I2C messages which read a block of bytes with a repeated start
+
+    The messages are cached since the same registers tend to be polled over and over.
+
+    Returns
+    -------
+    tuple
+        The I2C messages, in the format accepted by `I2C_Connection_Helper._direct_i2c`
+    """
+    device_address_byte = device_address << 1
+    if address_bitlength == 8:
+        commands = [I2CMessages.START, I2CMessages.WRITE2, device_address_byte, word_address & 0xFF]
+    elif address_bitlength == 16:
+        commands = [I2CMessages.START, I2CMessages.WRITE3, device_address_byte, (word_address >> 8) & 0xFF, word_address & 0xFF]
+    else:
+        raise RuntimeError("Unknown bit size trying to be sent")
+
+    commands += [I2CMessages.RESTART, I2CMessages.WRITE1, device_address_byte | 0x01]
+
+    # The last byte is read separately so that it can be NACKed
+    remaining = byte_count - 1
+    while remaining > 0:
+        this_read = min(remaining, 16)
+        commands += [_READ_COMMANDS[this_read]]
+        remaining -= this_read
+
+    commands += [I2CMessages.NACK, I2CMessages.READ1, I2CMessages.STOP]
+    return tuple(commands)
 
 
 class I2C_Connection_Helper:
@@ -61,7 +117,9 @@ class I2C_Connection_Helper:
         The maximum number of bytes which can be transmitted in a single I2C command
 
     successive_i2c_delay_us
-        The minimum delay in microseconds (us) between successive I2C commands
+        The minimum delay in microseconds (us) between successive I2C commands. Defaults to no delay, since
+        I2C adapters which wait for the bus transaction to complete do not need it. Derived classes for
+        connections which do need time for the bus to settle should set it, 10000 us being a conservative value.
 
     no_connect
         Mostly used for debugging, if set to True, no physical cconnection will
@@ -69,17 +127,30 @@ class I2C_Connection_Helper:
 
     """
 
+    # Whether _direct_i2c can carry several complete I2C transactions in a single message, so that sequential
+    # reads can be batched into fewer messages. Derived classes which support it should override these values.
+    _supports_batch = False
+    _max_batch_message_length: Union[int, None] = None
+    # Maximum number of bytes which can be read by a single direct I2C message
+    _max_batch_read_length: Union[int, None] = None
+    # Maximum number of bytes of each of the block reads in a direct I2C message
+    _max_batch_block_length: Union[int, None] = None
+
+    # Maximum number of bytes the connection can write in a single call of _write_i2c_device_memory, longer
+    # writes are always split into blocks. Derived classes with such a limit should override this value.
+    _max_write_byte_count: Union[int, None] = None
+
     def __init__(
         self,
         max_seq_byte: int,
-        successive_i2c_delay_us: int = 10000,
+        successive_i2c_delay_us: int = 0,
         no_connect: bool = False,
     ):
         self._max_seq_byte = max_seq_byte
 
         self._no_connect = no_connect
 
-        self._successive_i2c_delay_us = successive_i2c_delay_us
+        self.successive_i2c_delay_us = successive_i2c_delay_us
 
         self._logger = logging.getLogger("I2C_Log")
         self._logger.setLevel(logging.NOTSET)
@@ -101,6 +172,35 @@ class I2C_Connection_Helper:
         """
         return self._logger
 
+    @property
+    def successive_i2c_delay_us(self) -> int:
+        """The successive_i2c_delay_us property getter method
+
+        This method returns the minimum delay in microseconds (us) between successive I2C commands
+
+        Returns
+        -------
+        int
+            The delay in microseconds
+        """
+        return self._successive_i2c_delay_us
+
+    @successive_i2c_delay_us.setter
+    def successive_i2c_delay_us(self, value: int):
+        """The successive_i2c_delay_us property setter method
+
+        This method sets the minimum delay in microseconds (us) between successive I2C commands. The
+        equivalent delays in nanoseconds and seconds are cached, so they are not recomputed for each I2C command.
+
+        Parameters
+        ----------
+        value
+            The delay in microseconds
+        """
+        self._successive_i2c_delay_us = value
+        self._successive_i2c_delay_ns = value * 1000
+        self._successive_i2c_delay_s = value * 1e-6
+
     @property
     def connected(self):
         """The connected property getter method
@@ -114,7 +214,7 @@ class I2C_Connection_Helper:
         """
         return self._is_connected
 
-    def _check_i2c_device(self, device_address: int) -> bool:
+    def _check_i2c_device(self, device_address: int, force: bool = False) -> bool:
         """The internal method to check if an i2c device with the given address is connected
 
         This method must be implemented by the derived classes
@@ -124,6 +224,10 @@ class I2C_Connection_Helper:
         device_address
             The I2C address of the device to check. It must be a 7-bit address as per the I2C standard
 
+        force
+            If set, the bus must be probed even if the derived class keeps a record of the devices found. It is
+            only passed when set, so derived classes which do not keep such a record do not need to accept it
+
         Raises
         ------
         RuntimeError
@@ -243,7 +347,144 @@ class I2C_Connection_Helper:
         """
         raise RuntimeError("Derived classes must implement the individual device access methods: _direct_i2c")
 
-    def check_i2c_device(self, device_address: int) -> bool:
+    def _sequential_read_i2c_device_memory(
+        self,
+        device_address: int,
+        blocks: list[tuple[int, int, int, int]],
+        word_bytes: int,
+        read_type: str,
+        address_bitlength: int,
+    ) -> bytearray:
+        """The internal method to read several blocks of a device, with one call of _read_i2c_device_memory per block.
+
+        Parameters
+        ----------
+        device_address
+            The I2C address of the device to read from. It must be a 7-bit address as per the I2C standard.
+
+        blocks
+            The block descriptors, as returned by `_block_descriptors`
+
+        word_bytes
+            The number of bytes in each word
+
+        read_type
+            The type of protocol used for the actual reading procedure from the device.
+
+        address_bitlength
+            The length in bits of the address
+
+        Raises
+        ------
+        RuntimeError
+            If the number of bytes received for a block does not match the number of bytes requested
+
+        Returns
+        -------
+        bytearray
+            The bytes of all the blocks in the order presented on the I2C bus.
+        """
+        logger = self._logger
+        # Width of the formatted address, including the "0x" prefix
+        address_width = (address_bitlength + 3) // 4 + 2
+
+        byte_data = bytearray(sum(block[3] for block in blocks) * word_bytes)
+        byte_offset = 0
+        for i, (_, this_block_address, this_block_phys_address, this_block_words) in enumerate(blocks):
+            # Add here the possibility to call an external update function (for progress bars in GUI for instance)
+
+            bytes_to_read = this_block_words * word_bytes
+            logger.debug("Read operation %d: reading %d words starting from %#0*x", i, this_block_words, address_width, this_block_address)
+
+            now = time_ns()
+            if now - self._lastI2COperation < self._successive_i2c_delay_ns:
+                sleep(self._successive_i2c_delay_s)
+            this_data = self._read_i2c_device_memory(
+                device_address, this_block_phys_address, bytes_to_read, read_type=read_type, address_bitlength=address_bitlength
+            )
+            self._lastI2COperation = now
+            logger.debug("Got data: %r", this_data)
+
+            if len(this_data) != bytes_to_read:
+                raise RuntimeError("Did not receive the expected number of bytes")
+
+            byte_data[byte_offset : byte_offset + bytes_to_read] = this_data
+            byte_offset += bytes_to_read
+
+        return byte_data
+
+    def _batched_read_i2c_device_memory(
+        self,
+        device_address: int,
+        reads: list[tuple[int, int]],
+        address_bitlength: int,
+    ) -> list[int]:
+        """The internal method to read several blocks of a device with as few direct I2C messages as possible.
+
+        The repeated start reads of the blocks are concatenated into direct I2C messages, each message being at
+        most `_max_batch_message_length` long and reading at most `_max_batch_read_length` bytes, and sent with
+        `_direct_i2c`.
+
+        Parameters
+        ----------
+        device_address
+            The I2C address of the device to read from. It must be a 7-bit address as per the I2C standard.
+
+        reads
+            The blocks to read, as a list of `(word_address, byte_count)` tuples. The word addresses are sent as
+            they are on the I2C bus, so their endianness must already be correctly set.
+
+        address_bitlength
+            The length in bits of the address
+
+        Raises
+        ------
+        RuntimeError
+            If a block is too long to be read by a direct I2C message or if the number of bytes received does
+            not match the number of bytes requested
+
+        Returns
+        -------
+        list[int]
+            The list of bytes of all the blocks in the order presented on the I2C bus.
+        """
+        max_message_length = self._max_batch_message_length
+        max_read_length = self._max_batch_read_length
+        max_block_length = self._max_batch_block_length
+
+        batches = [[]]
+        batch_read_length = 0
+        for word_address, byte_count in reads:
+            if max_block_length is not None and byte_count > max_block_length:
+                raise RuntimeError(f"A block read of more than {max_block_length} bytes is not supported in a direct I2C message")
+            commands = _read_block_commands(device_address, word_address, byte_count, address_bitlength)
+            if (max_message_length is not None and len(commands) > max_message_length) or (
+                max_read_length is not None and byte_count > max_read_length
+            ):
+                raise RuntimeError(f"The read of {byte_count} bytes does not fit in a single direct I2C message")
+            if batches[-1] and (
+                (max_message_length is not None and len(batches[-1]) + len(commands) > max_message_length)
+                or (max_read_length is not None and batch_read_length + byte_count > max_read_length)
+            ):
+                batches += [[]]
+                batch_read_length = 0
+            batches[-1] += commands
+            batch_read_length += byte_count
+
+        byte_data = []
+        for batch in batches:
+            now = time_ns()
+            if now - self._lastI2COperation < self._successive_i2c_delay_ns:
+                sleep(self._successive_i2c_delay_s)
+            byte_data += self._direct_i2c(batch)
+            self._lastI2COperation = now
+
+        if len(byte_data) != sum(read[1] for read in reads):
+            raise RuntimeError("Did not receive the expected number of bytes")
+
+        return byte_data
+
+    def check_i2c_device(self, device_address: int, force: bool = False) -> bool:
         """The user method to check if a device with the `device_address` is connected to the I2C bus.
 
         This method makes use of the internal method _check_i2c_device
@@ -253,6 +494,10 @@ class I2C_Connection_Helper:
         device_address
             The I2C address of the device to write to. It must be a 7-bit address as per the I2C standard.
 
+        force
+            If set, the bus is always probed, even if the connection keeps a record of the devices found, for
+            instance from a previous bus scan
+
         Raises
         ------
         RuntimeError
@@ -263,22 +508,24 @@ class I2C_Connection_Helper:
         bool
             The presence or absence of the device with the `device_address`
         """
-        self._logger.info("Trying to find the I2C device with address 0x{:02x}".format(device_address))
+        self._logger.info("Trying to find the I2C device with address 0x%02x", device_address)
 
         if not self._is_connected or self._no_connect:
             self._logger.info("The I2C device is not connected or you are using software emulated mode.")
             return False
 
         now = time_ns()
-        if now - self._lastI2COperation < self._successive_i2c_delay_us * 1000:
-            sleep(self._successive_i2c_delay_us * 10**-6)
+        if now - self._lastI2COperation < self._successive_i2c_delay_ns:
+            sleep(self._successive_i2c_delay_s)
         self._lastI2COperation = now
 
-        if not self._check_i2c_device(device_address):
-            self._logger.info("The I2C device 0x{:02x} can not be found.".format(device_address))
+        # The force flag is only passed when set, to keep supporting derived classes without it
+        found = self._check_i2c_device(device_address, force=True) if force else self._check_i2c_device(device_address)
+        if not found:
+            self._logger.info("The I2C device 0x%02x can not be found.", device_address)
             return False
 
-        self._logger.info("The I2C device 0x{:02x} was found.".format(device_address))
+        self._logger.info("The I2C device 0x%02x was found.", device_address)
         return True
 
     def read_device_memory(
@@ -291,7 +538,8 @@ class I2C_Connection_Helper:
         word_bitlength: int = 8,
         word_endianness: str = 'big',
         read_type: str = 'Normal',
-    ) -> list[int]:
+        return_type: str = 'list',
+    ) -> Union[list[int], bytes]:
         """The user method to read register data from a device on the I2C bus with the given `device_address`.
 
         This method makes use of the internal method _read_i2c_device_memory
@@ -325,6 +573,11 @@ class I2C_Connection_Helper:
             The type of protocol used for the actual reading procedure from the device. Supported protocols
             are "Normal" and "Repeated Start". The Repeated Start protocol is implemented by the AD5593R chip.
 
+        return_type
+            The type of the returned data. Supported types are "list", which returns the list of words, and
+            "bytes", which returns the raw bytes in the order presented on the I2C bus without building a
+            Python int for each word.
+
         Raises
         ------
         RuntimeError
@@ -334,6 +587,8 @@ class I2C_Connection_Helper:
         -------
         list[int]
             The list of word in order. The words have been put together according to the endianness options set.
+        bytes
+            The bytes in the order presented on the I2C bus, if `return_type` is "bytes".
         """
         if not self._is_connected:
             raise RuntimeError("You must first connect to a device before trying to read registers from it")
@@ -350,86 +605,76 @@ class I2C_Connection_Helper:
         if read_type not in valid_read_type:
             raise RuntimeError(f"A wrong read type was set: {read_type}")
 
-        word_bytes = ceil(word_bitlength / 8)
+        if return_type not in valid_return_type:
+            raise RuntimeError(f"A wrong return type was set: {return_type}")
 
-        address_chars = ceil(address_bitlength / 4)
+        word_bytes = (word_bitlength + 7) // 8
 
+        # Width of the formatted address, including the "0x" prefix
+        address_width = (address_bitlength + 3) // 4 + 2
+
+        logger = self._logger
         if word_count == 1:
-            self._logger.info(
-                (f"Reading the register {{:#0{address_chars+2}x}} of the I2C device with address {{:#04x}}:").format(
-                    word_address, device_address
-                )
-            )
+            logger.info("Reading the register %#0*x of the I2C device with address %#04x:", address_width, word_address, device_address)
         else:
-            self._logger.info(
-                (
-                    f"Reading a register block with size {{}} starting at register {{:#0{address_chars+2}x}} of"
-                    f" the I2C device with address {{:#04x}}:"
-                ).format(word_count, word_address, device_address)
+            logger.info(
+                "Reading a register block with size %d starting at register %#0*x of the I2C device with address %#04x:",
+                word_count,
+                address_width,
+                word_address,
+                device_address,
             )
 
         byte_data = []
         if self._no_connect:
             if word_count == 1:
-                if word_bytes == 1:
-                    byte_data = [42]
-                else:
-                    byte_data = [0 for _ in range(word_bytes - 1)]
-                    if word_endianness == 'big':
-                        byte_data += [42]
-                    else:  # if word_endianness == 'little':
-                        byte_data = [42] + byte_data
+                byte_data = bytearray(word_bytes)
+                if word_endianness == 'big':
+                    byte_data[-1] = 42
+                else:  # if word_endianness == 'little':
+                    byte_data[0] = 42
             else:
-                byte_data = [i for i in range(word_count * word_bytes)]
-            self._logger.debug("Software emulation (no connect) is enabled, so returning dummy values: {}".format(repr(byte_data)))
+                byte_count = word_count * word_bytes
+                byte_data = (_DUMMY_BYTES * (byte_count // 256 + 1))[:byte_count]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Software emulation (no connect) is enabled, so returning dummy values: %r", list(byte_data))
         elif self._max_seq_byte is None:
             word_address = address_to_phys(word_address, address_bitlength, address_endianness)
             now = time_ns()
-            if now - self._lastI2COperation < self._successive_i2c_delay_us * 1000:
-                sleep(self._successive_i2c_delay_us * 10**-6)
+            if now - self._lastI2COperation < self._successive_i2c_delay_ns:
+                sleep(self._successive_i2c_delay_s)
             byte_data = self._read_i2c_device_memory(
                 device_address, word_address, word_count * word_bytes, read_type=read_type, address_bitlength=address_bitlength
             )
             self._lastI2COperation = now
-            self._logger.debug("Got data: {}".format(repr(byte_data)))
+            logger.debug("Got data: %r", byte_data)
         else:
-            byte_data = []
-            words_per_call = floor(self._max_seq_byte / word_bytes)
+            words_per_call = self._max_seq_byte // word_bytes
             if words_per_call == 0:
                 raise RuntimeError(
                     "The word length is too big for the maximum number of bytes in a single call, it is impossible"
                     " to read data in these conditions"
                 )
-            sequential_calls = ceil(word_count / words_per_call)
-            self._logger.debug("Breaking the read into {} individual reads of {} words".format(sequential_calls, words_per_call))
-
-            for i in range(sequential_calls):
-                # Add here the possibility to call an external update function (for progress bars in GUI for instance)
+            sequential_calls = -(-word_count // words_per_call)  # Integer ceiling division
+            logger.debug("Breaking the read into %d individual reads of %d words", sequential_calls, words_per_call)
 
-                this_block_address = word_address + i * words_per_call
-                this_block_words = min(words_per_call, word_count - i * words_per_call)
-                bytes_to_read = this_block_words * word_bytes
-
-                self._logger.debug(
-                    (f"Read operation {{}}: reading {{}} words starting from {{:#0{address_chars+2}x}}").format(
-                        i, this_block_words, this_block_address
-                    )
-                )
-
-                this_block_address = address_to_phys(this_block_address, address_bitlength, address_endianness)
-                now = time_ns()
-                if now - self._lastI2COperation < self._successive_i2c_delay_us * 1000:
-                    sleep(self._successive_i2c_delay_us * 10**-6)
-                this_data = self._read_i2c_device_memory(
-                    device_address, this_block_address, bytes_to_read, read_type=read_type, address_bitlength=address_bitlength
-                )
-                self._lastI2COperation = now
-                self._logger.debug("Got data: {}".format(repr(this_data)))
-
-                byte_data += this_data
+            blocks = _block_descriptors(
+                word_address, word_count, words_per_call, get_address_encoder(address_bitlength, address_endianness)
+            )
+            # Only the Repeated Start protocol matches the reads sent in the direct I2C messages
+            if self._supports_batch and read_type == 'Repeated Start' and len(blocks) > 1:
+                logger.debug("Batching the %d individual reads into direct I2C messages", len(blocks))
+                reads = [(phys_address, block_words * word_bytes) for _, _, phys_address, block_words in blocks]
+                byte_data = self._batched_read_i2c_device_memory(device_address, reads, address_bitlength)
+                logger.debug("Got data: %r", byte_data)
+            else:
+                byte_data = self._sequential_read_i2c_device_memory(device_address, blocks, word_bytes, read_type, address_bitlength)
 
             # Clear the progress from the function above
 
+        if return_type == 'bytes':
+            return bytes(byte_data)
+
         # Merge byte data back into words
         return bytes_to_word_list(byte_data, word_bytes, word_endianness)
 
@@ -437,7 +682,7 @@ class I2C_Connection_Helper:
         self,
         device_address: int,
         word_address: int,
-        data: list[int],
+        data: Union[list[int], bytes, bytearray, memoryview],
         address_bitlength: int = 8,
         address_endianness: str = 'big',
         word_bitlength: int = 8,
@@ -457,7 +702,8 @@ class I2C_Connection_Helper:
             The address of the first byte to be written to.
 
         data
-            The register word data to be written to the I2C device.
+            The register word data to be written to the I2C device. For 8-bit register words, a bytes-like
+            object can also be used.
 
         address_bitlength
             The bit length of the address, typical values are 8 and 16.
@@ -493,74 +739,83 @@ class I2C_Connection_Helper:
         if word_endianness not in valid_endianness:
             raise RuntimeError(f"A wrong word endianness was set: {word_endianness}")
 
-        if write_type not in valid_read_type:
+        if write_type not in valid_write_type:
             raise RuntimeError(f"A wrong write type was set: {write_type}")
 
-        address_chars = ceil(address_bitlength / 4)
-        word_chars = ceil(word_bitlength / 4)
-        word_bytes = ceil(word_bitlength / 8)
+        # Widths of the formatted address and words, including the "0x" prefix
+        address_width = (address_bitlength + 3) // 4 + 2
+        word_width = (word_bitlength + 3) // 4 + 2
+        word_bytes = (word_bitlength + 7) // 8
         word_count = len(data)
 
+        max_seq_byte = self._max_seq_byte
+        if self._max_write_byte_count is not None and (max_seq_byte is None or max_seq_byte > self._max_write_byte_count):
+            max_seq_byte = self._max_write_byte_count
+
+        logger = self._logger
         if word_count == 1:
-            self._logger.info(
-                (
-                    f"Writing the value {{:#0{word_chars+2}x}} to the register {{:#0{address_chars+2}x}} of"
-                    f" the I2C device with address {{:#04x}}:"
-                ).format(data[0], word_address, device_address)
+            logger.info(
+                "Writing the value %#0*x to the register %#0*x of the I2C device with address %#04x:",
+                word_width,
+                data[0],
+                address_width,
+                word_address,
+                device_address,
             )
         else:
-            self._logger.info(
-                (
-                    f"Writing a register block with size {{}} starting at register {{:#0{address_chars+2}x}} of"
-                    f" the I2C device with address {{:#04x}}. Writing the value array: {{}}"
-                ).format(word_count, word_address, device_address, repr(data))
+            logger.info(
+                "Writing a register block with size %d starting at register %#0*x of the I2C device with address %#04x."
+                " Writing the value array: %r",
+                word_count,
+                address_width,
+                word_address,
+                device_address,
+                data,
             )
 
         if self._no_connect:
-            self._logger.debug("Software emulation (no connect) is enabled, so no write action is taken.")
-        elif self._max_seq_byte is None:
-            self._logger.debug("Writing the full block at once.")
+            logger.debug("Software emulation (no connect) is enabled, so no write action is taken.")
+        elif max_seq_byte is None:
+            logger.debug("Writing the full block at once.")
             word_address = address_to_phys(word_address, address_bitlength, address_endianness)
             byte_data = word_list_to_bytes(data, word_bytes, word_endianness)
             now = time_ns()
-            if now - self._lastI2COperation < self._successive_i2c_delay_us * 1000:
-                sleep(self._successive_i2c_delay_us * 10**-6)
+            if now - self._lastI2COperation < self._successive_i2c_delay_ns:
+                sleep(self._successive_i2c_delay_s)
             self._write_i2c_device_memory(
                 device_address, word_address, byte_data, write_type=write_type, address_bitlength=address_bitlength
             )
             self._lastI2COperation = now
         else:
-            words_per_call = floor(self._max_seq_byte / word_bytes)
+            words_per_call = max_seq_byte // word_bytes
             if words_per_call == 0:
                 raise RuntimeError(
                     "The word length is too big for the maximum number of bytes in a single call, it is impossible to"
                     " write data in these conditions"
                 )
-            sequential_calls = ceil(word_count / words_per_call)
-            self._logger.debug("Breaking the write into {} individual writes of {} words".format(sequential_calls, words_per_call))
+            sequential_calls = -(-word_count // words_per_call)  # Integer ceiling division
+            logger.debug("Breaking the write into %d individual writes of %d words", sequential_calls, words_per_call)
 
-            for i in range(sequential_calls):
+            blocks = _block_descriptors(
+                word_address, word_count, words_per_call, get_address_encoder(address_bitlength, address_endianness)
+            )
+            for i, (word_offset, this_block_address, this_block_phys_address, this_block_words) in enumerate(blocks):
                 # Add here the possibility to call an external update function (for progress bars in GUI for instance)
 
-                this_block_address = word_address + i * words_per_call
-                this_block_words = min(words_per_call, word_count - i * words_per_call)
                 bytes_to_write = this_block_words * word_bytes
-                self._logger.debug(
-                    (f"Write operation {{}}: writing {{}} words starting from {{:#0{address_chars+2}x}}").format(
-                        i, bytes_to_write, this_block_address
-                    )
+                logger.debug(
+                    "Write operation %d: writing %d words starting from %#0*x", i, bytes_to_write, address_width, this_block_address
                 )
 
-                this_data = data[i * words_per_call : i * words_per_call + this_block_words]
-                self._logger.debug("Current block: {}".format(repr(this_data)))
+                this_data = data[word_offset : word_offset + this_block_words]
+                logger.debug("Current block: %r", this_data)
 
-                this_block_address = address_to_phys(this_block_address, address_bitlength, address_endianness)
                 this_byte_data = word_list_to_bytes(this_data, word_bytes, word_endianness)
                 now = time_ns()
-                if now - self._lastI2COperation < self._successive_i2c_delay_us * 1000:
-                    sleep(self._successive_i2c_delay_us * 10**-6)
+                if now - self._lastI2COperation < self._successive_i2c_delay_ns:
+                    sleep(self._successive_i2c_delay_s)
                 self._write_i2c_device_memory(
-                    device_address, this_block_address, this_byte_data, write_type=write_type, address_bitlength=address_bitlength
+                    device_address, this_block_phys_address, this_byte_data, write_type=write_type, address_bitlength=address_bitlength
                 )
                 self._lastI2COperation = now
 
@@ -29,13 +29,14 @@ custom I2C command sequences using user friendly names.
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import IntEnum
 
 
-class I2CMessages(Enum):
+class I2CMessages(IntEnum):
     """Class to wrap the I2C Messages unique identifiers
 
-    This is a temporary description
+    This is a temporary description. The members are ints with the value of the command, so they can be
+    placed directly in a byte buffer.
 
     Examples
     --------
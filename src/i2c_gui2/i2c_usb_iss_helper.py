@@ -23,18 +23,68 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from functools import partial
+from time import sleep
+from time import time_ns
 from typing import Union
 
 from usb_iss import UsbIss
 from usb_iss import defs
 
+from .functions import bytes_to_word_list
+from .functions import get_address_encoder
+from .functions import valid_i2c_address
 from .i2c_connection_helper import I2C_Connection_Helper
+from .i2c_connection_helper import _read_block_commands
+from .i2c_connection_helper import valid_endianness
 from .i2c_messages import I2CMessages
 
 valid_clocks = [20, 50, 100, 400, 1000]
 software_clocks = [20, 50, 100, 400]
 hardware_clocks = [100, 400, 1000]
 
+# Number of payload bytes following each of the WRITEn direct I2C commands
+_WRITE_PAYLOAD_LENGTH = {getattr(I2CMessages, f"WRITE{n}"): n for n in range(1, 17)}
+
+# All the known I2C commands. I2CMessages is an IntEnum, so the set lookup rejects unknown values but also accepts
+# plain ints (and bools) equal to the value of a command
+_VALID_I2C_CMDS = frozenset(I2CMessages)
+
+# Serial number and firmware version of the USB-ISS devices which have been opened, by port. Only devices with the
+# expected module ID are stored.
+_device_info_cache: dict[str, tuple[str, int]] = {}
+
+
+@lru_cache(maxsize=4096)
+def _read_block_message(device_address: int, word_address: int, byte_count: int, address_bitlength: int) -> bytes:
+    """Build the direct I2C message which reads a block of bytes with a repeated start
+
+    The message is cached as a frozen bytes object, so the polled registers are read without building it again.
+    """
+    return bytes(_read_block_commands(device_address, word_address, byte_count, address_bitlength))
+
+
+def _merge_contiguous_writes(writes: list[tuple[int, list[int]]], max_length: int) -> list[tuple[int, list[int]]]:
+    """Merge consecutive writes to contiguous addresses into single writes of at most `max_length` bytes
+
+    Writes longer than `max_length` are first split into writes of at most `max_length` bytes.
+    """
+    merged = []
+    for word_address, byte_data in writes:
+        for offset in range(0, len(byte_data), max_length):
+            this_address = word_address + offset
+            this_data = byte_data[offset : offset + max_length]
+            if merged:
+                last_address, last_data = merged[-1]
+                if last_address + len(last_data) == this_address and len(last_data) + len(this_data) <= max_length:
+                    last_data.extend(this_data)
+                    continue
+            merged += [(this_address, list(this_data))]
+    return merged
+
 
 class USB_ISS_Helper(I2C_Connection_Helper):
     """Class to handle the USB-ISS connection
@@ -71,6 +121,22 @@ class USB_ISS_Helper(I2C_Connection_Helper):
     dummy_connect
         If set, the connection to the USB-ISS will be emulated and a dummy device will be configured
 
+    successive_i2c_delay_us
+        The minimum delay in microseconds (us) between successive I2C commands. The USB-ISS only returns once
+        the I2C transaction is complete, so by default no delay is added.
+
+    batch_reads
+        If set, Repeated Start block reads which are broken into several sequential reads are instead sent to
+        the USB-ISS as direct I2C messages containing several reads each, reducing the number of USB round trips
+
+    low_latency
+        If set, the serial port used to talk to the USB-ISS is placed in low latency mode, where supported,
+        so that the replies from the USB-ISS are not held back by the serial driver
+
+    cache_device_info
+        If set, the module ID and firmware version of the USB-ISS are remembered per port and are not queried
+        again when the same device, identified by its serial number, is reopened on that port
+
     Raises
     ------
     SerialException
@@ -98,6 +164,18 @@ class USB_ISS_Helper(I2C_Connection_Helper):
     _iss: UsbIss
     _fw_version: int
     _serial: str
+    _device_cache: Union[frozenset[int], None]
+
+    # Maximum number of bytes in the direct I2C messages used for batched reads, kept below the size of the
+    # USB-ISS command buffer
+    _max_batch_message_length = 60
+    # Maximum number of bytes which can be read by a single direct I2C message
+    _max_batch_read_length = defs.I2C_AD1_MAX_READ_BYTE_COUNT
+    # Maximum number of bytes of each block read, as for the Repeated Start reads
+    _max_batch_block_length = 16
+
+    # Maximum number of data bytes in a single write_ad1 or write_ad2 call
+    _max_write_byte_count = min(defs.I2C_AD1_MAX_WRITE_BYTE_COUNT, defs.I2C_AD2_MAX_WRITE_BYTE_COUNT)
 
     def __init__(
         self,
@@ -108,8 +186,14 @@ class USB_ISS_Helper(I2C_Connection_Helper):
         verbose: bool = False,
         max_seq_byte: int = 8,
         dummy_connect: bool = False,
+        successive_i2c_delay_us: int = 0,
+        batch_reads: bool = False,
+        low_latency: bool = True,
+        cache_device_info: bool = False,
     ):
-        super().__init__(max_seq_byte=max_seq_byte, no_connect=dummy_connect)
+        super().__init__(max_seq_byte=max_seq_byte, successive_i2c_delay_us=successive_i2c_delay_us, no_connect=dummy_connect)
+        self._supports_batch = batch_reads
+        self._device_cache = None
         if clock not in valid_clocks:
             raise ValueError(f"Received a wrong clock value: {clock} kHz")
 
@@ -127,13 +211,27 @@ class USB_ISS_Helper(I2C_Connection_Helper):
 
         self._iss = UsbIss(dummy=dummy_connect, verbose=self._verbose)
         self._iss.open(port)
+        if low_latency:
+            self._enable_low_latency()
+
+        if cache_device_info and not dummy_connect:
+            self._serial = self._iss.read_serial_number()
+            cached_info = _device_info_cache.get(port)
+            if cached_info is not None and cached_info[0] == self._serial:
+                self._fw_version = cached_info[1]
+            else:
+                module_id = self._iss.read_module_id()
+                if module_id != 7:
+                    raise RuntimeError(f"Got an unexpected value for the module ID of the USB-ISS device: {module_id}")
+                self._fw_version = self._iss.read_fw_version()
+                _device_info_cache[port] = (self._serial, self._fw_version)
+        else:
+            module_id = self._iss.read_module_id()
+            if module_id != 7 and not dummy_connect:
+                raise RuntimeError(f"Got an unexpected value for the module ID of the USB-ISS device: {module_id}")
 
-        module_id = self._iss.read_module_id()
-        if module_id != 7 and not dummy_connect:
-            raise RuntimeError(f"Got an unexpected value for the module ID of the USB-ISS device: {module_id}")
-
-        self._fw_version = self._iss.read_fw_version()
-        self._serial = self._iss.read_serial_number()
+            self._fw_version = self._iss.read_fw_version()
+            self._serial = self._iss.read_serial_number()
 
         self._use_hardware = False
         if self._clock in hardware_clocks:
@@ -146,6 +244,21 @@ class USB_ISS_Helper(I2C_Connection_Helper):
 
         self._is_connected = True
 
+    def _enable_low_latency(self):
+        """The internal method to enable the low latency mode of the serial port used by the USB-ISS.
+
+        The low latency mode is only available on POSIX systems with a driver which supports it, when it is not
+        available the serial port is left with its default settings.
+        """
+        serial_port = getattr(getattr(self._iss, "_drv", None), "_serial", None)
+        if serial_port is None:
+            return
+
+        try:
+            serial_port.set_low_latency_mode(True)
+        except (IOError, NotImplementedError, AttributeError, ValueError):
+            self._logger.debug("Unable to enable the low latency mode on the USB-ISS serial port")
+
     def __del__(self):
         if hasattr(self, "_iss"):
             if self._iss is not None:
@@ -231,28 +344,65 @@ class USB_ISS_Helper(I2C_Connection_Helper):
         """
         return self._baud_rate
 
-    def _check_i2c_device(self, device_address: int) -> bool:
+    def scan_bus(self) -> frozenset[int]:
+        """The user method to find all the devices connected to the I2C bus.
+
+        All the non-reserved 7-bit addresses are probed and the addresses of the devices which are found are
+        stored, so that subsequent device checks do not need to probe the bus again. Call this method again
+        to refresh the stored addresses if the devices on the bus change.
+
+        Raises
+        ------
+        RuntimeError
+            If the USB-ISS is not connected
+
+        Returns
+        -------
+        frozenset[int]
+            The addresses of the devices found on the I2C bus
+        """
+        if not self._is_connected:
+            raise RuntimeError("You must first connect to a device before trying to scan the I2C bus")
+
+        if self._no_connect:
+            self._logger.info("Software emulation (no connect) is enabled, so no devices are found on the I2C bus")
+            self._device_cache = frozenset()
+            return self._device_cache
+
+        # The USB-ISS aborts a direct I2C sequence at the first NACK, so each address must be probed separately
+        test = self._iss.i2c.test
+        self._device_cache = frozenset(address for address in range(0x08, 0x78) if test(address))
+        self._logger.info("Found %d devices on the I2C bus", len(self._device_cache))
+        return self._device_cache
+
+    def _check_i2c_device(self, device_address: int, force: bool = False) -> bool:
         """The internal method to check if an i2c device with the given address is connected
 
-        This method overrides the one from the base class.
+        This method overrides the one from the base class. If the bus has been scanned with `scan_bus`, the
+        result of the scan is used instead of probing the bus.
 
         Parameters
         ----------
         device_address
             The I2C address of the device to check. It must be a 7-bit address as per the I2C standard
 
+        force
+            If set, the bus is always probed, even if it has been scanned before
+
         Returns
         -------
         bool
             The presence or absence of the device with the `device_address`
         """
+        if self._device_cache is not None and not force:
+            return device_address in self._device_cache
         return self._iss.i2c.test(device_address)
 
     def _write_i2c_device_memory(
         self,
         device_address: int,
         word_address: int,
-        byte_data: list[int],
+        byte_data: Union[list[int], bytes, bytearray, memoryview],
         write_type: str = 'Normal',
         address_bitlength: int = 8,
     ):
@@ -272,7 +422,7 @@ class USB_ISS_Helper(I2C_Connection_Helper):
         byte_data
             The byte data to be written to the I2C device. The data is written to the I2C bus in the order
             given, so the endianness of the data must be correctly set, assuming the device contains registers
-            larger than 8 bits.
+            larger than 8 bits. Bytes-like objects are also accepted.
 
         write_type
             The type of protocol used for the actual writing procedure to the device.
@@ -286,6 +436,9 @@ class USB_ISS_Helper(I2C_Connection_Helper):
             If a not supported configuration is chosen
         """
         if write_type == 'Normal':
+            # The usb_iss library concatenates the data to its command list, so it only accepts lists
+            if type(byte_data) is not list:
+                byte_data = list(byte_data)
             if address_bitlength == 16:
                 self._iss.i2c.write_ad2(device_address, word_address, byte_data)
             elif address_bitlength == 8:
@@ -347,46 +500,14 @@ class USB_ISS_Helper(I2C_Connection_Helper):
             else:
                 raise RuntimeError("Unknown bit size trying to be sent")
         elif read_type == "Repeated Start":
-            direct_msg = [defs.I2CDirect.START]
-
-            device_address_byte = device_address << 1
-            if address_bitlength == 8:
-                direct_msg += [
-                    defs.I2CDirect.WRITE2,
-                    device_address_byte,
-                    word_address & 0xFF,
-                ]
-            elif address_bitlength == 16:
-                direct_msg += [
-                    defs.I2CDirect.WRITE3,
-                    device_address_byte,
-                    (word_address >> 8) & 0xFF,
-                    word_address & 0xFF,
-                ]
-            else:
+            if address_bitlength not in (8, 16):
                 raise RuntimeError("Unknown bit size trying to be sent")
-
-            direct_msg += [
-                defs.I2CDirect.RESTART,
-                defs.I2CDirect.WRITE1,
-                device_address_byte | 0x01,
-            ]
-
-            if byte_count <= 16:
-                if byte_count > 1:
-                    direct_msg += [
-                        getattr(defs.I2CDirect, f"READ{byte_count-1}"),
-                    ]
-            else:
+            if byte_count > 16:
                 raise RuntimeError("USB ISS does not support a block read of more than 16 bytes")
 
-            direct_msg += [
-                defs.I2CDirect.NACK,
-                defs.I2CDirect.READ1,
-                defs.I2CDirect.STOP,
-            ]
+            direct_msg = _read_block_message(device_address, word_address, byte_count, address_bitlength)
 
-            retVal = self._iss.i2c.direct(direct_msg)
+            retVal = self._direct_i2c_raw(direct_msg)
 
             if len(retVal) != byte_count:
                 raise RuntimeError("Did not receive the expected number of bytes")
@@ -395,7 +516,171 @@ class USB_ISS_Helper(I2C_Connection_Helper):
         else:
             raise RuntimeError("Unknown read type chosen for the USB ISS")
 
-    def _direct_i2c(self, commands: list[I2CMessages]) -> list[int]:  # noqa: C901
+    def write_batch(
+        self,
+        device_address: int,
+        writes: list[tuple[int, list[int]]],
+        address_bitlength: int = 8,
+    ):
+        """The user method to write several blocks of bytes to a device with as few USB transactions as possible.
+
+        Consecutive writes to contiguous addresses are merged into a single write, limited by the maximum number
+        of sequential bytes, and longer writes are split. If all the resulting writes fit in a single direct I2C message, they are sent to the
+        USB-ISS at once, otherwise they are sent one after the other. The writes are always issued in the given order.
+
+        Parameters
+        ----------
+        device_address
+            The I2C address of the device to write to. It must be a 7-bit address as per the I2C standard.
+
+        writes
+            The writes to perform, as a list of `(word_address, byte_data)` tuples. The word addresses and byte
+            data are sent as they are on the I2C bus, so their endianness must already be correctly set.
+
+        address_bitlength
+            The length in bits of the address
+
+        Raises
+        ------
+        RuntimeError
+            If there is an issue identified during runtime
+        """
+        if not self._is_connected:
+            raise RuntimeError("You must first connect to a device before trying to write registers to it")
+
+        if not valid_i2c_address(device_address):
+            raise RuntimeError("Invalid I2C address received: {:#04x}".format(device_address))
+
+        if address_bitlength == 8:
+            address_bytes = 1
+            max_length = defs.I2C_AD1_MAX_WRITE_BYTE_COUNT
+        elif address_bitlength == 16:
+            address_bytes = 2
+            max_length = defs.I2C_AD2_MAX_WRITE_BYTE_COUNT
+        else:
+            raise RuntimeError("Unknown bit size trying to be sent")
+        if self._max_seq_byte is not None:
+            max_length = min(max_length, self._max_seq_byte)
+
+        address_limit = 1 << address_bitlength
+        for word_address, byte_data in writes:
+            if not 0 <= word_address < address_limit:
+                raise RuntimeError(f"Invalid word address received: {word_address:#x}")
+            try:
+                bytes(byte_data)
+            except (ValueError, TypeError):
+                raise RuntimeError(f"Invalid data byte in the write to the word address {word_address:#x}") from None
+
+        runs = _merge_contiguous_writes(writes, max_length)
+        if not runs:
+            return
+
+        self._logger.info(
+            "Writing %d blocks, merged into %d writes, to the I2C device with address %#04x", len(writes), len(runs), device_address
+        )
+        if self._no_connect:
+            self._logger.debug("Software emulation (no connect) is enabled, so no write action is taken.")
+            return
+
+        # Each write in a direct message is: START, WRITEn, device address, word address, data, STOP
+        direct_msg = bytearray()
+        for word_address, byte_data in runs:
+            write_length = 1 + address_bytes + len(byte_data)
+            if write_length > 16:
+                direct_msg = None
+                break
+            direct_msg.extend((I2CMessages.START, I2CMessages[f"WRITE{write_length}"], device_address << 1))
+            direct_msg.extend(word_address.to_bytes(address_bytes, 'big'))
+            direct_msg.extend(byte_data)
+            direct_msg.append(I2CMessages.STOP)
+
+        if direct_msg is not None and len(direct_msg) <= self._max_batch_message_length:
+            now = time_ns()
+            if now - self._lastI2COperation < self._successive_i2c_delay_ns:
+                sleep(self._successive_i2c_delay_s)
+            self._direct_i2c_raw(direct_msg)
+            self._lastI2COperation = now
+        else:
+            for word_address, byte_data in runs:
+                now = time_ns()
+                if now - self._lastI2COperation < self._successive_i2c_delay_ns:
+                    sleep(self._successive_i2c_delay_s)
+                self._write_i2c_device_memory(device_address, word_address, byte_data, address_bitlength=address_bitlength)
+                self._lastI2COperation = now
+
+    def read_multi(
+        self,
+        device_address: int,
+        word_addresses: list[int],
+        byte_counts: list[int],
+        address_bitlength: int = 8,
+    ) -> list[list[int]]:
+        """The user method to read several, not necessarily contiguous, blocks of bytes from a device at once.
+
+        The repeated start reads of all the blocks are concatenated into as few direct I2C messages as possible,
+        so that several blocks are read in a single USB transaction.
+
+        Parameters
+        ----------
+        device_address
+            The I2C address of the device to read from. It must be a 7-bit address as per the I2C standard.
+
+        word_addresses
+            The address of the first byte of each block. The addresses are sent as they are on the I2C bus,
+            so their endianness must already be correctly set.
+
+        byte_counts
+            The number of bytes to read from each block, at most 16 bytes per block
+
+        address_bitlength
+            The length in bits of the address
+
+        Raises
+        ------
+        RuntimeError
+            If there is an issue identified during runtime
+
+        Returns
+        -------
+        list[list[int]]
+            The bytes of each block in the order presented on the I2C bus, in the same order as `word_addresses`
+        """
+        if not self._is_connected:
+            raise RuntimeError("You must first connect to a device before trying to read registers from it")
+
+        if not valid_i2c_address(device_address):
+            raise RuntimeError("Invalid I2C address received: {:#04x}".format(device_address))
+
+        if len(word_addresses) != len(byte_counts):
+            raise RuntimeError("The number of word addresses and byte counts must be the same")
+
+        if address_bitlength not in (8, 16):
+            raise RuntimeError("Unknown bit size trying to be sent")
+
+        for byte_count in byte_counts:
+            if byte_count < 1:
+                raise RuntimeError("At least one byte must be read from each block")
+            if byte_count > 16:
+                raise RuntimeError("USB ISS does not support a block read of more than 16 bytes")
+
+        if not word_addresses:
+            return []
+
+        self._logger.info("Reading %d blocks from the I2C device with address %#04x", len(word_addresses), device_address)
+        if self._no_connect:
+            self._logger.debug("Software emulation (no connect) is enabled, so returning dummy values.")
+            return [list(range(byte_count)) for byte_count in byte_counts]
+
+        byte_data = self._batched_read_i2c_device_memory(device_address, list(zip(word_addresses, byte_counts)), address_bitlength)
+
+        blocks = []
+        offset = 0
+        for byte_count in byte_counts:
+            blocks += [byte_data[offset : offset + byte_count]]
+            offset += byte_count
+        return blocks
+
+    def _direct_i2c(self, commands: list[I2CMessages]) -> list[int]:
         """The internal method to send arbitrary I2C messages to the I2C bus.
 
         This method overrides the one from the base class.
@@ -408,194 +693,206 @@ class USB_ISS_Helper(I2C_Connection_Helper):
         Raises
         ------
         RuntimeError
-            If an unknown command is trying to be sent
+            If an unknown command is trying to be sent, or if the bytes following a write command are missing or are
+            not valid bytes
 
         Returns
         -------
         list[int]
             The list of bytes returned to the I2C Bus in the order presented on the I2C bus.
         """
-        direct_msg = []
+        direct_msg = bytearray()
+        append = direct_msg.append
+        extend = direct_msg.extend
+        valid_commands = _VALID_I2C_CMDS
+        payload_lengths = _WRITE_PAYLOAD_LENGTH
 
         idx = 0
-        while True:
-            if idx >= len(commands):
-                break
-
+        command_count = len(commands)
+        while idx < command_count:
             command = commands[idx]
-            if command not in I2CMessages:
+            if command not in valid_commands:
                 raise RuntimeError("Unknown I2C command")
 
-            direct_msg += [command.value]
-            if command == I2CMessages.WRITE1:
-                direct_msg += [commands[idx + 1]]
-                idx += 2
-            elif command == I2CMessages.WRITE2:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                idx += 3
-            elif command == I2CMessages.WRITE3:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                idx += 4
-            elif command == I2CMessages.WRITE4:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                idx += 5
-            elif command == I2CMessages.WRITE5:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                direct_msg += [commands[idx + 5]]
-                idx += 6
-            elif command == I2CMessages.WRITE6:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                direct_msg += [commands[idx + 5]]
-                direct_msg += [commands[idx + 6]]
-                idx += 7
-            elif command == I2CMessages.WRITE7:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                direct_msg += [commands[idx + 5]]
-                direct_msg += [commands[idx + 6]]
-                direct_msg += [commands[idx + 7]]
-                idx += 8
-            elif command == I2CMessages.WRITE8:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                direct_msg += [commands[idx + 5]]
-                direct_msg += [commands[idx + 6]]
-                direct_msg += [commands[idx + 7]]
-                direct_msg += [commands[idx + 8]]
-                idx += 9
-            elif command == I2CMessages.WRITE9:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                direct_msg += [commands[idx + 5]]
-                direct_msg += [commands[idx + 6]]
-                direct_msg += [commands[idx + 7]]
-                direct_msg += [commands[idx + 8]]
-                direct_msg += [commands[idx + 9]]
-                idx += 10
-            elif command == I2CMessages.WRITE10:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                direct_msg += [commands[idx + 5]]
-                direct_msg += [commands[idx + 6]]
-                direct_msg += [commands[idx + 7]]
-                direct_msg += [commands[idx + 8]]
-                direct_msg += [commands[idx + 9]]
-                direct_msg += [commands[idx + 10]]
-                idx += 11
-            elif command == I2CMessages.WRITE11:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                direct_msg += [commands[idx + 5]]
-                direct_msg += [commands[idx + 6]]
-                direct_msg += [commands[idx + 7]]
-                direct_msg += [commands[idx + 8]]
-                direct_msg += [commands[idx + 9]]
-                direct_msg += [commands[idx + 10]]
-                direct_msg += [commands[idx + 11]]
-                idx += 12
-            elif command == I2CMessages.WRITE12:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                direct_msg += [commands[idx + 5]]
-                direct_msg += [commands[idx + 6]]
-                direct_msg += [commands[idx + 7]]
-                direct_msg += [commands[idx + 8]]
-                direct_msg += [commands[idx + 9]]
-                direct_msg += [commands[idx + 10]]
-                direct_msg += [commands[idx + 11]]
-                direct_msg += [commands[idx + 12]]
-                idx += 13
-            elif command == I2CMessages.WRITE13:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                direct_msg += [commands[idx + 5]]
-                direct_msg += [commands[idx + 6]]
-                direct_msg += [commands[idx + 7]]
-                direct_msg += [commands[idx + 8]]
-                direct_msg += [commands[idx + 9]]
-                direct_msg += [commands[idx + 10]]
-                direct_msg += [commands[idx + 11]]
-                direct_msg += [commands[idx + 12]]
-                direct_msg += [commands[idx + 13]]
-                idx += 14
-            elif command == I2CMessages.WRITE14:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                direct_msg += [commands[idx + 5]]
-                direct_msg += [commands[idx + 6]]
-                direct_msg += [commands[idx + 7]]
-                direct_msg += [commands[idx + 8]]
-                direct_msg += [commands[idx + 9]]
-                direct_msg += [commands[idx + 10]]
-                direct_msg += [commands[idx + 11]]
-                direct_msg += [commands[idx + 12]]
-                direct_msg += [commands[idx + 13]]
-                direct_msg += [commands[idx + 14]]
-                idx += 15
-            elif command == I2CMessages.WRITE15:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                direct_msg += [commands[idx + 5]]
-                direct_msg += [commands[idx + 6]]
-                direct_msg += [commands[idx + 7]]
-                direct_msg += [commands[idx + 8]]
-                direct_msg += [commands[idx + 9]]
-                direct_msg += [commands[idx + 10]]
-                direct_msg += [commands[idx + 11]]
-                direct_msg += [commands[idx + 12]]
-                direct_msg += [commands[idx + 13]]
-                direct_msg += [commands[idx + 14]]
-                direct_msg += [commands[idx + 15]]
-                idx += 16
-            elif command == I2CMessages.WRITE16:
-                direct_msg += [commands[idx + 1]]
-                direct_msg += [commands[idx + 2]]
-                direct_msg += [commands[idx + 3]]
-                direct_msg += [commands[idx + 4]]
-                direct_msg += [commands[idx + 5]]
-                direct_msg += [commands[idx + 6]]
-                direct_msg += [commands[idx + 7]]
-                direct_msg += [commands[idx + 8]]
-                direct_msg += [commands[idx + 9]]
-                direct_msg += [commands[idx + 10]]
-                direct_msg += [commands[idx + 11]]
-                direct_msg += [commands[idx + 12]]
-                direct_msg += [commands[idx + 13]]
-                direct_msg += [commands[idx + 14]]
-                direct_msg += [commands[idx + 15]]
-                direct_msg += [commands[idx + 16]]
-                idx += 17
-            else:
-                idx += 1
+            # The WRITEn commands are followed by the n bytes to write, which are copied as they are
+            payload_length = payload_lengths.get(command, 0)
+            # I2CMessages is an IntEnum, so the command is already the byte to send
+            append(command)
+            idx += 1
+            if payload_length:
+                payload = commands[idx : idx + payload_length]
+                if len(payload) != payload_length:
+                    raise RuntimeError(f"Missing payload bytes for {I2CMessages(command).name} starting at index {idx - 1}")
+                try:
+                    extend(payload)
+                except (ValueError, TypeError):
+                    raise RuntimeError(f"Invalid payload byte for {I2CMessages(command).name} starting at index {idx - 1}") from None
+                idx += payload_length
+
+        return self._direct_i2c_raw(direct_msg)
+
+    def _direct_i2c_raw(self, direct_msg: Union[bytes, bytearray]) -> list[int]:
+        """The internal method to send an already assembled direct I2C message to the USB-ISS.
 
+        No validation is performed, the message must be made of valid USB-ISS direct I2C commands and data.
+
+        Parameters
+        ----------
+        direct_msg
+            The bytes of the direct I2C message, as sent to the USB-ISS.
+
+        Returns
+        -------
+        list[int]
+            The list of bytes returned to the I2C Bus in the order presented on the I2C bus.
+        """
         return self._iss.i2c.direct(direct_msg)
+
+
+class AsyncUSB_ISS_Helper(USB_ISS_Helper):
+    """Class to handle the USB-ISS connection from asyncio code
+
+    This class adds awaitable versions of the user methods of the USB_ISS_Helper class, so that the USB
+    transactions do not block the event loop, for instance of a GUI. The transactions are run in a single
+    worker thread, so they are still sent to the USB-ISS one at a time and in the order they were requested.
+    The parameters are the same as for the USB_ISS_Helper class.
+
+    Examples
+    --------
+    >>> import i2c_gui2
+    >>> usbiss = i2c_gui2.AsyncUSB_ISS_Helper("/dev/ttyACM0", 100)
+    >>> data = await usbiss.read_device_memory_async(0x60, 0x00, 4)
+
+    """
+
+    _io_pool: ThreadPoolExecutor
+
+    def __init__(self, *args, **kwargs):
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="usb_iss")
+        super().__init__(*args, **kwargs)
+
+    def __del__(self):
+        if hasattr(self, "_io_pool"):
+            self._io_pool.shutdown(wait=False)
+        super().__del__()
+
+    async def _run_in_io_thread(self, function, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(self._io_pool, partial(function, *args, **kwargs))
+
+    async def check_i2c_device_async(self, device_address: int, force: bool = False) -> bool:
+        """The awaitable version of the check_i2c_device method, see check_i2c_device for the details"""
+        return await self._run_in_io_thread(self.check_i2c_device, device_address, force=force)
+
+    async def read_device_memory_async(
+        self, device_address: int, word_address: int, word_count: int = 1, **kwargs
+    ) -> Union[list[int], bytes]:
+        """The awaitable version of the read_device_memory method, see read_device_memory for the details"""
+        return await self._run_in_io_thread(self.read_device_memory, device_address, word_address, word_count, **kwargs)
+
+    async def write_device_memory_async(self, device_address: int, word_address: int, data: list[int], **kwargs):
+        """The awaitable version of the write_device_memory method, see write_device_memory for the details"""
+        return await self._run_in_io_thread(self.write_device_memory, device_address, word_address, data, **kwargs)
+
+    async def gather_reads(
+        self,
+        device_address: int,
+        reads: list[tuple[int, int]],
+        address_bitlength: int = 8,
+        address_endianness: str = 'big',
+        word_bitlength: int = 8,
+        word_endianness: str = 'big',
+    ) -> list[list[int]]:
+        """The user method to read several register blocks of a device with as few USB transactions as possible.
+
+        Consecutive reads of contiguous ranges are merged into a single read and long reads are split, so that each
+        read is at most `max_seq_byte` and 16 bytes long. All the resulting reads are sent with `read_multi`, so they
+        are packed into as few direct I2C messages as possible.
+
+        Parameters
+        ----------
+        device_address
+            The I2C address of the device to read from. It must be a 7-bit address as per the I2C standard.
+
+        reads
+            The register blocks to read, as a list of `(word_address, word_count)` tuples
+
+        address_bitlength
+            The bit length of the address, typical values are 8 and 16.
+
+        address_endianness
+            The endianness of the address as presented on the I2C bus.
+
+        word_bitlength
+            The bit length of the register words, typical values are 8 and 16.
+
+        word_endianness
+            The endianness of the register words as presented on the I2C bus.
+
+        Raises
+        ------
+        RuntimeError
+            If there is an issue identified during runtime
+
+        Returns
+        -------
+        list[list[int]]
+            The words of each block, in the same order as `reads`
+        """
+        return await self._run_in_io_thread(
+            self._gather_reads, device_address, reads, address_bitlength, address_endianness, word_bitlength, word_endianness
+        )
+
+    def _gather_reads(
+        self,
+        device_address: int,
+        reads: list[tuple[int, int]],
+        address_bitlength: int,
+        address_endianness: str,
+        word_bitlength: int,
+        word_endianness: str,
+    ) -> list[list[int]]:
+        if address_endianness not in valid_endianness:
+            raise RuntimeError(f"A wrong address endianness was set: {address_endianness}")
+
+        if word_endianness not in valid_endianness:
+            raise RuntimeError(f"A wrong word endianness was set: {word_endianness}")
+
+        word_bytes = (word_bitlength + 7) // 8
+
+        # Each block read is limited by the device and by the USB-ISS Repeated Start reads
+        max_block_bytes = 16 if self._max_seq_byte is None else min(self._max_seq_byte, 16)
+        words_per_block = max_block_bytes // word_bytes
+        if words_per_block == 0:
+            raise RuntimeError(
+                "The word length is too big for the maximum number of bytes in a single call, it is impossible"
+                " to read data in these conditions"
+            )
+
+        # Each block is [word_address, word_count], contiguous reads are merged and long ones split
+        blocks = []
+        for word_address, word_count in reads:
+            end_address = word_address + word_count
+            while word_address < end_address:
+                if blocks and blocks[-1][0] + blocks[-1][1] == word_address and blocks[-1][1] < words_per_block:
+                    this_count = min(words_per_block - blocks[-1][1], end_address - word_address)
+                    blocks[-1][1] += this_count
+                else:
+                    this_count = min(words_per_block, end_address - word_address)
+                    blocks += [[word_address, this_count]]
+                word_address += this_count
+
+        encode_address = get_address_encoder(address_bitlength, address_endianness)
+        block_data = self.read_multi(
+            device_address,
+            [encode_address(block[0]) for block in blocks],
+            [block[1] * word_bytes for block in blocks],
+            address_bitlength=address_bitlength,
+        )
+        byte_data = [byte for data in block_data for byte in data]
+
+        words = []
+        offset = 0
+        for _, word_count in reads:
+            words += [bytes_to_word_list(byte_data[offset : offset + word_count * word_bytes], word_bytes, word_endianness)]
+            offset += word_count * word_bytes
+        return words
@@ -26,6 +26,7 @@ import pytest
 
 from i2c_gui2.functions import address_to_phys
 from i2c_gui2.functions import bytes_to_word_list
+from i2c_gui2.functions import get_address_encoder
 from i2c_gui2.functions import is_valid_hostname
 from i2c_gui2.functions import is_valid_ip
 from i2c_gui2.functions import swap_endian_16bit
@@ -138,6 +139,10 @@ def test_address_to_phys_32bit_little():
     assert address_to_phys(0x21763454, bitlength=32, endianness='little') == 0x54347621
 
 
+def test_address_to_phys_24bit_big():
+    assert address_to_phys(0x217634, bitlength=24, endianness='big') == 0x217634
+
+
 def test_address_to_phys_fail():
     with pytest.raises(Exception) as e_info:
         address_to_phys(0x21763454, bitlength=23, endianness='little')
@@ -199,3 +204,45 @@ def test_bytes_to_word_list_32bit_big():
 
 def test_bytes_to_word_list_32bit_little():
     assert bytes_to_word_list([0x21, 0x34, 0x76, 0x12], bytelength=4, endianness='little') == [0x12763421]
+
+
+def test_word_list_to_bytes_16bit_truncates():
+    assert word_list_to_bytes([0x13210], bytelength=2, endianness='big') == [0x32, 0x10]
+
+
+def test_bytes_to_word_list_16bit_from_bytes():
+    assert bytes_to_word_list(bytes([0x21, 0x34, 0x76, 0x12]), bytelength=2, endianness='big') == [0x2134, 0x7612]
+
+
+def test_bytes_to_word_list_fail():
+    with pytest.raises(Exception) as e_info:
+        bytes_to_word_list([0x21, 0x34, 0x76], bytelength=2, endianness='big')
+    assert e_info.match(r"^The number of bytes \(3\) is not a multiple of the word length \(2\)")
+
+
+def test_word_list_to_bytes_24bit_big():
+    assert word_list_to_bytes([0x321034, 0x862850], bytelength=3, endianness='big') == [0x32, 0x10, 0x34, 0x86, 0x28, 0x50]
+
+
+def test_bytes_to_word_list_24bit_little():
+    assert bytes_to_word_list([0x21, 0x34, 0x76, 0x12, 0x43, 0x65], bytelength=3, endianness='little') == [0x763421, 0x654312]
+
+
+def test_bytes_to_word_list_8bit_bytearray():
+    assert bytes_to_word_list(bytearray([0x21, 0x34]), bytelength=1, endianness='big') == [0x21, 0x34]
+
+
+def test_get_address_encoder():
+    assert get_address_encoder(bitlength=16, endianness='big')(0x2113) == 0x2113
+    assert get_address_encoder(bitlength=16, endianness='little')(0x2113) == 0x1321
+    assert get_address_encoder(bitlength=32, endianness='little')(0x21763454) == 0x54347621
+
+
+def test_get_address_encoder_fail():
+    with pytest.raises(Exception) as e_info:
+        get_address_encoder(bitlength=23, endianness='little')
+    assert e_info.match(r"^Endian swap not implemented for bit length 23")
+
+
+def test_bytes_to_word_list_40bit_big():
+    assert bytes_to_word_list([0x21, 0x34, 0x76, 0x12, 0x43], bytelength=5, endianness='big') == [0x2134761243]
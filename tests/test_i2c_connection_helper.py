@@ -72,6 +72,17 @@ def test_i2c_delay(i2c_ch_i2c_delay, i2c_ch_test):
     assert i2c_ch_i2c_delay == i2c_ch_test._successive_i2c_delay_us
 
 
+def test_i2c_delay_default(i2c_ch_max_seq_byte):
+    assert I2C_Connection_Helper(max_seq_byte=i2c_ch_max_seq_byte).successive_i2c_delay_us == 0
+
+
+def test_i2c_delay_setter(i2c_ch_test):
+    i2c_ch_test.successive_i2c_delay_us = 250
+    assert i2c_ch_test.successive_i2c_delay_us == 250
+    assert i2c_ch_test._successive_i2c_delay_ns == 250000
+    assert i2c_ch_test._successive_i2c_delay_s == pytest.approx(250e-6)
+
+
 def test_no_connect(i2c_ch_no_connect, i2c_ch_test):
     assert i2c_ch_no_connect == i2c_ch_test._no_connect
 
@@ -136,6 +147,17 @@ def test_fake_connect_monkeypatch(connect_return_value, fake_connect, i2c_ch_tes
     assert i2c_ch_test._check_i2c_device(0x21) == connect_return_value
 
 
+@pytest.mark.parametrize('i2c_ch_no_connect', [False])
+def test_check_i2c_device_legacy_hook(monkeypatch, i2c_ch_test):
+    # Derived classes written before the force flag was added only accept the device address
+    checked = []
+    monkeypatch.setattr(I2C_Connection_Helper, "_check_i2c_device", lambda self, device_address: checked.append(device_address) or True)
+    i2c_ch_test._is_connected = True
+
+    assert i2c_ch_test.check_i2c_device(0x21)
+    assert checked == [0x21]
+
+
 @pytest.mark.parametrize('i2c_ch_no_connect', [True, False])
 @pytest.mark.parametrize('connect_return_value', [True, False])
 def test_check_i2c_device(caplog, connect_return_value, fake_connect, i2c_ch_no_connect, i2c_ch_test):
@@ -225,6 +247,13 @@ def test_read_device_memory_invalid_read_type(i2c_ch_test):
     assert e_info.match(r"^A wrong read type was set: blabla")
 
 
+def test_read_device_memory_invalid_return_type(i2c_ch_test):
+    i2c_ch_test._is_connected = True
+    with pytest.raises(Exception) as e_info:
+        i2c_ch_test.read_device_memory(0x21, 0x00, 1, return_type='blabla')
+    assert e_info.match(r"^A wrong return type was set: blabla")
+
+
 def test_write_device_memory_invalid_read_type(i2c_ch_test):
     i2c_ch_test._is_connected = True
     with pytest.raises(Exception) as e_info:
@@ -232,6 +261,13 @@ def test_write_device_memory_invalid_read_type(i2c_ch_test):
     assert e_info.match(r"^A wrong write type was set: blabla")
 
 
+def test_write_device_memory_repeated_start_write_type(i2c_ch_test):
+    i2c_ch_test._is_connected = True
+    with pytest.raises(Exception) as e_info:
+        i2c_ch_test.write_device_memory(0x21, 0x00, [0x54], write_type='Repeated Start')
+    assert e_info.match(r"^A wrong write type was set: Repeated Start")
+
+
 @pytest.mark.parametrize('words', [1, 2, 4])
 @pytest.mark.parametrize('bitlength', [8, 16])
 @pytest.mark.parametrize('endianness', ['big', 'little'])
@@ -492,3 +528,137 @@ def test_write_device_memory(caplog, i2c_ch_test, words, bitlength, endianness,
                 assert "Writing the value" in log_tuples[0][2]
             else:
                 assert "Writing a register block with size" in log_tuples[0][2]
+
+
+@pytest.mark.parametrize('i2c_ch_max_seq_byte', [None, 2, 8])
+@pytest.mark.parametrize('i2c_ch_no_connect', [False])
+@pytest.mark.parametrize('words', [1, 4])
+@pytest.mark.parametrize('bitlength', [8, 16])
+def test_read_device_memory_return_bytes(i2c_ch_test, words, bitlength):
+    i2c_ch_test._is_connected = True
+
+    byte_count = words * ceil(bitlength / 8)
+    ret_list = [random.getrandbits(8) for _ in range(byte_count)]
+
+    def fake_read(device_address, word_address, byte_count, read_type='Normal', address_bitlength=8):
+        offset = word_address * ceil(bitlength / 8)
+        return ret_list[offset : offset + byte_count]
+
+    with patch('i2c_gui2.i2c_connection_helper.I2C_Connection_Helper._read_i2c_device_memory', side_effect=fake_read):
+        byte_data = i2c_ch_test.read_device_memory(0x21, 0x00, words, word_bitlength=bitlength, return_type='bytes')
+
+    assert isinstance(byte_data, bytes)
+    assert byte_data == bytes(ret_list)
+
+
+@pytest.mark.parametrize('i2c_ch_max_seq_byte', [2])
+@pytest.mark.parametrize('i2c_ch_no_connect', [False])
+@pytest.mark.parametrize('bitlength', [8, 16])
+def test_read_device_memory_batched(i2c_ch_test, bitlength):
+    i2c_ch_test._is_connected = True
+    i2c_ch_test._supports_batch = True
+
+    words = 4
+    byte_count = words * ceil(bitlength / 8)
+    ret_list = [random.getrandbits(8) for _ in range(byte_count)]
+
+    with patch('i2c_gui2.i2c_connection_helper.I2C_Connection_Helper._direct_i2c') as function:
+        function.return_value = ret_list
+
+        word_list = i2c_ch_test.read_device_memory(0x21, 0x10, words, word_bitlength=bitlength, read_type='Repeated Start')
+
+        function.assert_called_once()
+        commands = function.call_args.args[0]
+        assert commands[:4] == [I2CMessages.START, I2CMessages.WRITE2, 0x21 << 1, 0x10]
+        assert commands.count(I2CMessages.STOP) == byte_count // 2
+        assert word_list == bytes_to_word_list(ret_list, ceil(bitlength / 8), 'big')
+
+
+@pytest.mark.parametrize('i2c_ch_max_seq_byte', [1])
+@pytest.mark.parametrize('i2c_ch_no_connect', [False])
+def test_read_device_memory_batched_message_length(i2c_ch_test):
+    i2c_ch_test._is_connected = True
+    i2c_ch_test._supports_batch = True
+    i2c_ch_test._max_batch_message_length = 20
+
+    with patch('i2c_gui2.i2c_connection_helper.I2C_Connection_Helper._direct_i2c') as function:
+        function.side_effect = lambda commands: [0x55 for _ in range(commands.count(I2CMessages.STOP))]
+
+        word_list = i2c_ch_test.read_device_memory(0x21, 0x10, 5, read_type='Repeated Start')
+
+        # Each single byte read takes 10 bytes of message, so two reads fit in each message
+        assert function.call_count == 3
+        assert word_list == [0x55] * 5
+
+
+@pytest.mark.parametrize('i2c_ch_max_seq_byte', [2])
+@pytest.mark.parametrize('i2c_ch_no_connect', [False])
+def test_read_device_memory_batched_normal(i2c_ch_test):
+    i2c_ch_test._is_connected = True
+    i2c_ch_test._supports_batch = True
+
+    with (
+        patch('i2c_gui2.i2c_connection_helper.I2C_Connection_Helper._direct_i2c') as direct,
+        patch('i2c_gui2.i2c_connection_helper.I2C_Connection_Helper._read_i2c_device_memory') as read,
+    ):
+        read.return_value = [0x01, 0x02]
+
+        assert i2c_ch_test.read_device_memory(0x21, 0x10, 4) == [0x01, 0x02, 0x01, 0x02]
+
+        direct.assert_not_called()
+        assert read.call_count == 2
+
+
+@pytest.mark.parametrize('i2c_ch_max_seq_byte', [32])
+@pytest.mark.parametrize('i2c_ch_no_connect', [False])
+def test_read_device_memory_batched_block_length(i2c_ch_test):
+    i2c_ch_test._is_connected = True
+    i2c_ch_test._supports_batch = True
+    i2c_ch_test._max_batch_block_length = 16
+
+    with patch('i2c_gui2.i2c_connection_helper.I2C_Connection_Helper._direct_i2c') as function:
+        with pytest.raises(Exception) as e_info:
+            i2c_ch_test.read_device_memory(0x21, 0x10, 64, read_type='Repeated Start')
+        assert e_info.match(r"^A block read of more than 16 bytes is not supported in a direct I2C message")
+        function.assert_not_called()
+
+
+@pytest.mark.parametrize('i2c_ch_max_seq_byte', [4])
+@pytest.mark.parametrize('i2c_ch_no_connect', [False])
+def test_read_device_memory_batched_oversize(i2c_ch_test):
+    i2c_ch_test._is_connected = True
+    i2c_ch_test._supports_batch = True
+    i2c_ch_test._max_batch_read_length = 2
+
+    with patch('i2c_gui2.i2c_connection_helper.I2C_Connection_Helper._direct_i2c') as function:
+        with pytest.raises(Exception) as e_info:
+            i2c_ch_test.read_device_memory(0x21, 0x10, 8, read_type='Repeated Start')
+        assert e_info.match(r"^The read of 4 bytes does not fit in a single direct I2C message")
+        function.assert_not_called()
+
+
+@pytest.mark.parametrize('i2c_ch_max_seq_byte', [2])
+@pytest.mark.parametrize('i2c_ch_no_connect', [False])
+def test_read_device_memory_batched_wrong_size(i2c_ch_test):
+    i2c_ch_test._is_connected = True
+    i2c_ch_test._supports_batch = True
+
+    with patch('i2c_gui2.i2c_connection_helper.I2C_Connection_Helper._direct_i2c') as function:
+        function.return_value = [0x01]
+
+        with pytest.raises(Exception) as e_info:
+            i2c_ch_test.read_device_memory(0x21, 0x10, 4, read_type='Repeated Start')
+        assert e_info.match(r"^Did not receive the expected number of bytes")
+
+
+@pytest.mark.parametrize('i2c_ch_max_seq_byte', [2])
+@pytest.mark.parametrize('i2c_ch_no_connect', [False])
+def test_read_device_memory_wrong_size(i2c_ch_test):
+    i2c_ch_test._is_connected = True
+
+    with patch('i2c_gui2.i2c_connection_helper.I2C_Connection_Helper._read_i2c_device_memory') as function:
+        function.return_value = [0x01]
+
+        with pytest.raises(Exception) as e_info:
+            i2c_ch_test.read_device_memory(0x21, 0x00, 4)
+        assert e_info.match(r"^Did not receive the expected number of bytes")
@@ -24,6 +24,12 @@
 from i2c_gui2.i2c_messages import I2CMessages
 
 
+def test_int_enum():
+    # The direct I2C message assembly relies on the members being ints
+    assert issubclass(I2CMessages, int)
+    assert bytes([I2CMessages.START, I2CMessages.WRITE1]) == bytes([0x01, 0x30])
+
+
 def test_start():
     assert I2CMessages.START.value == 0x01
 
@@ -21,6 +21,7 @@
 # 3. This notice may not be removed or altered from any source distribution.
 #############################################################################
 
+import asyncio
 from unittest.mock import call
 from unittest.mock import patch
 
@@ -28,7 +29,9 @@ import pytest
 from usb_iss import defs
 
 from i2c_gui2.i2c_messages import I2CMessages
+from i2c_gui2.i2c_usb_iss_helper import AsyncUSB_ISS_Helper
 from i2c_gui2.i2c_usb_iss_helper import USB_ISS_Helper
+from i2c_gui2.i2c_usb_iss_helper import _read_block_message
 
 
 @pytest.fixture
@@ -146,6 +149,12 @@ def test_no_mock(usb_iss_test):
     assert usb_iss_test.connected
 
 
+@pytest.mark.parametrize('dummy_connect', [True])
+def test_batch_reads(port, clock, dummy_connect):
+    assert not USB_ISS_Helper(port=port, clock=clock, dummy_connect=dummy_connect)._supports_batch
+    assert USB_ISS_Helper(port=port, clock=clock, dummy_connect=dummy_connect, batch_reads=True)._supports_batch
+
+
 def test_invalid_clock(port, use_serial, baud_rate, verbose, max_seq_byte, dummy_connect):
     with pytest.raises(Exception) as e_info:
         USB_ISS_Helper(
@@ -176,6 +185,38 @@ def test__check_i2c_device(mock_usb_iss, usb_iss_mocked, connected, device_addre
     assert usb_iss_mocked._check_i2c_device(device_address) == connected
 
 
+def test_scan_bus(mock_usb_iss, usb_iss_mocked):
+    mock_usb_iss.i2c = mock_usb_iss
+    mock_usb_iss.test.side_effect = lambda address: address in [0x21, 0x30]
+
+    assert usb_iss_mocked.scan_bus() == frozenset([0x21, 0x30])
+    assert mock_usb_iss.test.call_count == 0x78 - 0x08
+
+    mock_usb_iss.test.reset_mock()
+    assert usb_iss_mocked._check_i2c_device(0x30)
+    assert not usb_iss_mocked._check_i2c_device(0x31)
+    mock_usb_iss.test.assert_not_called()
+
+    mock_usb_iss.test.side_effect = None
+    mock_usb_iss.test.return_value = False
+    assert not usb_iss_mocked._check_i2c_device(0x30, force=True)
+    mock_usb_iss.test.assert_called_once_with(0x30)
+
+    mock_usb_iss.test.reset_mock()
+    assert usb_iss_mocked.check_i2c_device(0x30)
+    mock_usb_iss.test.assert_not_called()
+    assert not usb_iss_mocked.check_i2c_device(0x30, force=True)
+    mock_usb_iss.test.assert_called_once_with(0x30)
+
+
+@pytest.mark.parametrize('dummy_connect', [True])
+def test_scan_bus_no_connect(mock_usb_iss, usb_iss_mocked):
+    mock_usb_iss.i2c = mock_usb_iss
+
+    assert usb_iss_mocked.scan_bus() == frozenset()
+    mock_usb_iss.test.assert_not_called()
+
+
 @pytest.mark.parametrize("write_type,bitlength", [("Normal", 8), ("Normal", 16)])
 @pytest.mark.parametrize("device_address", [0x30])
 @pytest.mark.parametrize("word_address", [0x14])
@@ -191,6 +232,17 @@ def test__write_i2c_device_memory(mock_usb_iss, usb_iss_mocked, write_type, bitl
             mock_usb_iss.write_ad1.assert_has_calls([call(device_address, word_address, data)])
 
 
+@pytest.mark.parametrize("bitlength", [8, 16])
+@pytest.mark.parametrize("data", [bytes([0x01, 0x21]), bytearray([0x01, 0x21]), memoryview(bytes([0x01, 0x21]))])
+def test__write_i2c_device_memory_bytes_like(mock_usb_iss, usb_iss_mocked, bitlength, data):
+    mock_usb_iss.i2c = mock_usb_iss
+    usb_iss_mocked._write_i2c_device_memory(0x30, 0x14, data, "Normal", bitlength)
+
+    write_method = mock_usb_iss.write_ad2 if bitlength == 16 else mock_usb_iss.write_ad1
+    write_method.assert_called_once_with(0x30, 0x14, [0x01, 0x21])
+    assert type(write_method.call_args.args[2]) is list
+
+
 @pytest.mark.parametrize("write_type,bitlength", [("Alternate", 16), ("Normal", 24)])
 @pytest.mark.parametrize("device_address", [0x30])
 @pytest.mark.parametrize("word_address", [0x14])
@@ -261,7 +313,9 @@ def test__read_i2c_device_memory(mock_usb_iss, usb_iss_mocked, read_type, bitlen
                 defs.I2CDirect.READ1,
                 defs.I2CDirect.STOP,
             ]
-        mock_usb_iss.direct.assert_has_calls([call(direct_msg)])
+        direct_msg = [item.value if isinstance(item, defs.I2CDirect) else item for item in direct_msg]
+        mock_usb_iss.direct.assert_called_once()
+        assert list(mock_usb_iss.direct.call_args.args[0]) == direct_msg
         assert read_data == data
 
 
@@ -456,6 +510,95 @@ def test__direct_i2c(mock_usb_iss, usb_iss_mocked):
     assert message == "My very unique string"
 
 
+def test__direct_i2c_message(mock_usb_iss, usb_iss_mocked):
+    mock_usb_iss.i2c = mock_usb_iss
+    mock_usb_iss.direct.return_value = [0x12, 0x34]
+
+    commands = [
+        I2CMessages.START,
+        I2CMessages.WRITE2,
+        0x60,
+        0x14,
+        I2CMessages.RESTART,
+        I2CMessages.WRITE1,
+        0x61,
+        I2CMessages.NACK,
+        I2CMessages.READ2,
+        I2CMessages.STOP,
+    ]
+    message = usb_iss_mocked._direct_i2c(commands)
+
+    mock_usb_iss.direct.assert_called_once()
+    assert list(mock_usb_iss.direct.call_args.args[0]) == [0x01, 0x31, 0x60, 0x14, 0x02, 0x30, 0x61, 0x04, 0x21, 0x03]
+    assert message == [0x12, 0x34]
+
+
+def test_cache_device_info(mock_usb_iss, clock):
+    mock_usb_iss.read_module_id.return_value = 7
+    mock_usb_iss.read_fw_version.return_value = "My Version"
+    mock_usb_iss.read_serial_number.return_value = "My Serial"
+
+    with patch.dict('i2c_gui2.i2c_usb_iss_helper._device_info_cache', clear=True):
+        first = USB_ISS_Helper(port="cached port", clock=clock, cache_device_info=True)
+        second = USB_ISS_Helper(port="cached port", clock=clock, cache_device_info=True)
+
+        assert first.fw_version == "My Version"
+        assert second.fw_version == "My Version"
+        assert second.serial == "My Serial"
+        mock_usb_iss.read_module_id.assert_called_once()
+        mock_usb_iss.read_fw_version.assert_called_once()
+        assert mock_usb_iss.read_serial_number.call_count == 2
+
+        mock_usb_iss.read_serial_number.return_value = "Other Serial"
+        USB_ISS_Helper(port="cached port", clock=clock, cache_device_info=True)
+        assert mock_usb_iss.read_module_id.call_count == 2
+        assert mock_usb_iss.read_fw_version.call_count == 2
+
+
+def test_low_latency(mock_usb_iss, usb_iss_mocked):
+    mock_usb_iss._drv._serial.set_low_latency_mode.assert_called_once_with(True)
+
+
+def test_low_latency_disabled(mock_usb_iss, port, clock):
+    mock_usb_iss.read_module_id.return_value = 7
+
+    USB_ISS_Helper(port=port, clock=clock, low_latency=False)
+
+    mock_usb_iss._drv._serial.set_low_latency_mode.assert_not_called()
+
+
+def test_low_latency_not_supported(mock_usb_iss, port, clock):
+    mock_usb_iss.read_module_id.return_value = 7
+    mock_usb_iss._drv._serial.set_low_latency_mode.side_effect = NotImplementedError
+
+    helper = USB_ISS_Helper(port=port, clock=clock)
+
+    assert helper.connected
+
+
+@pytest.mark.parametrize("device_address", [0x30])
+def test__read_i2c_device_memory_rstart_cached(mock_usb_iss, usb_iss_mocked, device_address):
+    mock_usb_iss.i2c = mock_usb_iss
+    mock_usb_iss.direct.return_value = [0x01, 0x02]
+
+    usb_iss_mocked._read_i2c_device_memory(device_address, 0x14, 2, read_type="Repeated Start")
+    usb_iss_mocked._read_i2c_device_memory(device_address, 0x14, 2, read_type="Repeated Start")
+
+    first_message, second_message = (called.args[0] for called in mock_usb_iss.direct.call_args_list)
+    assert first_message is second_message
+    assert isinstance(first_message, bytes)
+    assert _read_block_message.cache_info().hits > 0
+
+
+def test__direct_i2c_raw(mock_usb_iss, usb_iss_mocked):
+    mock_usb_iss.i2c = mock_usb_iss
+    mock_usb_iss.direct.return_value = [0x12]
+
+    message = bytes([defs.I2CDirect.START.value, defs.I2CDirect.WRITE1.value, 0x61, defs.I2CDirect.READ1.value])
+    assert usb_iss_mocked._direct_i2c_raw(message) == [0x12]
+    mock_usb_iss.direct.assert_called_once_with(message)
+
+
 def test_fail__direct_i2c(mock_usb_iss, usb_iss_mocked):
     mock_usb_iss.i2c = mock_usb_iss
 
@@ -465,3 +608,278 @@ def test_fail__direct_i2c(mock_usb_iss, usb_iss_mocked):
         usb_iss_mocked._direct_i2c(commands)
 
     assert e_info.match(r"^Unknown I2C command")
+
+
+@pytest.mark.parametrize(
+    "commands,message",
+    [
+        ([I2CMessages.START, I2CMessages.WRITE2, 0x60, 256], r"^Invalid payload byte for WRITE2 starting at index 1"),
+        ([I2CMessages.START, I2CMessages.WRITE1, "a"], r"^Invalid payload byte for WRITE1 starting at index 1"),
+        ([I2CMessages.START, I2CMessages.WRITE3, 0x60, 0x01], r"^Missing payload bytes for WRITE3 starting at index 1"),
+    ],
+)
+def test_fail__direct_i2c_payload(mock_usb_iss, usb_iss_mocked, commands, message):
+    mock_usb_iss.i2c = mock_usb_iss
+
+    with pytest.raises(Exception) as e_info:
+        usb_iss_mocked._direct_i2c(commands)
+
+    assert e_info.match(message)
+    mock_usb_iss.direct.assert_not_called()
+
+
+@pytest.mark.parametrize("device_address", [0x30])
+def test_write_batch_direct(mock_usb_iss, usb_iss_mocked, device_address):
+    mock_usb_iss.i2c = mock_usb_iss
+
+    usb_iss_mocked.write_batch(device_address, [(0x10, [0x01, 0x02]), (0x12, [0x03]), (0x20, [0x04])])
+
+    mock_usb_iss.direct.assert_called_once()
+    mock_usb_iss.write_ad1.assert_not_called()
+    assert list(mock_usb_iss.direct.call_args.args[0]) == [
+        defs.I2CDirect.START.value,
+        defs.I2CDirect.WRITE5.value,
+        device_address << 1,
+        0x10,
+        0x01,
+        0x02,
+        0x03,
+        defs.I2CDirect.STOP.value,
+        defs.I2CDirect.START.value,
+        defs.I2CDirect.WRITE3.value,
+        device_address << 1,
+        0x20,
+        0x04,
+        defs.I2CDirect.STOP.value,
+    ]
+
+
+@pytest.mark.parametrize("max_seq_byte", [None])
+@pytest.mark.parametrize("device_address", [0x30])
+def test_write_batch_individual(mock_usb_iss, usb_iss_mocked, device_address):
+    mock_usb_iss.i2c = mock_usb_iss
+
+    data = [i for i in range(20)]
+    usb_iss_mocked.write_batch(device_address, [(0x1000, data[:10]), (0x100A, data[10:]), (0x2000, [0x04])], address_bitlength=16)
+
+    mock_usb_iss.direct.assert_not_called()
+    mock_usb_iss.write_ad2.assert_has_calls([call(device_address, 0x1000, data), call(device_address, 0x2000, [0x04])])
+
+
+@pytest.mark.parametrize("max_seq_byte,call_lengths", [(8, [8] * 12 + [4]), (None, [60, 40])])
+@pytest.mark.parametrize("device_address", [0x30])
+def test_write_batch_split(mock_usb_iss, usb_iss_mocked, device_address, call_lengths):
+    mock_usb_iss.i2c = mock_usb_iss
+
+    data = list(range(100))
+    usb_iss_mocked.write_batch(device_address, [(0x00, data)])
+
+    mock_usb_iss.direct.assert_not_called()
+    expected_calls = []
+    offset = 0
+    for length in call_lengths:
+        expected_calls += [call(device_address, offset, data[offset : offset + length])]
+        offset += length
+    assert mock_usb_iss.write_ad1.call_args_list == expected_calls
+
+
+def test_fail_write_batch(mock_usb_iss, usb_iss_mocked):
+    mock_usb_iss.i2c = mock_usb_iss
+
+    with pytest.raises(Exception) as e_info:
+        usb_iss_mocked.write_batch(0x80, [(0x10, [0x01])])
+    assert e_info.match(r"^Invalid I2C address received: 0x80")
+
+    with pytest.raises(Exception) as e_info:
+        usb_iss_mocked.write_batch(0x30, [(0x10, [0x01])], address_bitlength=24)
+    assert e_info.match(r"^Unknown bit size trying to be sent")
+
+    with pytest.raises(Exception) as e_info:
+        usb_iss_mocked.write_batch(0x30, [(0x100, [0x01])])
+    assert e_info.match(r"^Invalid word address received: 0x100")
+
+    with pytest.raises(Exception) as e_info:
+        usb_iss_mocked.write_batch(0x30, [(0x10, [0x01]), (0x20, [0x100])])
+    assert e_info.match(r"^Invalid data byte in the write to the word address 0x20")
+
+    mock_usb_iss.direct.assert_not_called()
+    mock_usb_iss.write_ad1.assert_not_called()
+
+
+def test_write_batch_empty(mock_usb_iss, usb_iss_mocked):
+    mock_usb_iss.i2c = mock_usb_iss
+
+    usb_iss_mocked.write_batch(0x30, [])
+
+    mock_usb_iss.direct.assert_not_called()
+    mock_usb_iss.write_ad1.assert_not_called()
+
+
+@pytest.mark.parametrize("device_address", [0x30])
+def test_async_helper(mock_usb_iss, port, clock, device_address):
+    mock_usb_iss.read_module_id.return_value = 7
+    mock_usb_iss.i2c = mock_usb_iss
+    mock_usb_iss.test.return_value = True
+    mock_usb_iss.read_ad1.side_effect = lambda device, address, count: [address + i for i in range(count)]
+
+    helper = AsyncUSB_ISS_Helper(port=port, clock=clock)
+
+    async def run():
+        found = await helper.check_i2c_device_async(device_address)
+        data = await helper.read_device_memory_async(device_address, 0x10, 2)
+        await helper.write_device_memory_async(device_address, 0x20, [0x01, 0x02])
+        return found, data
+
+    found, data = asyncio.run(run())
+
+    assert found
+    assert data == [0x10, 0x11]
+    mock_usb_iss.write_ad1.assert_called_once_with(device_address, 0x20, [0x01, 0x02])
+
+
+@pytest.mark.parametrize("device_address", [0x30])
+def test_read_multi(mock_usb_iss, usb_iss_mocked, device_address):
+    mock_usb_iss.i2c = mock_usb_iss
+    mock_usb_iss.direct.return_value = [0x01, 0x02, 0x03]
+
+    assert usb_iss_mocked.read_multi(device_address, [0x10, 0x40], [1, 2]) == [[0x01], [0x02, 0x03]]
+
+    mock_usb_iss.direct.assert_called_once()
+    device_address_byte = device_address << 1
+    read_1 = [
+        defs.I2CDirect.START.value,
+        defs.I2CDirect.WRITE2.value,
+        device_address_byte,
+        0x10,
+        defs.I2CDirect.RESTART.value,
+        defs.I2CDirect.WRITE1.value,
+        device_address_byte | 0x01,
+        defs.I2CDirect.NACK.value,
+        defs.I2CDirect.READ1.value,
+        defs.I2CDirect.STOP.value,
+    ]
+    read_2 = read_1[:3] + [0x40] + read_1[4:7] + [defs.I2CDirect.READ1.value] + read_1[7:]
+    assert list(mock_usb_iss.direct.call_args.args[0]) == read_1 + read_2
+
+
+@pytest.mark.parametrize("device_address", [0x30])
+def test_read_multi_split(mock_usb_iss, usb_iss_mocked, device_address):
+    mock_usb_iss.i2c = mock_usb_iss
+    # Each read message is 12 bytes long, so only 5 fit in a single direct message
+    mock_usb_iss.direct.side_effect = lambda message: [0xAA, 0xBB] * (len(message) // 12)
+
+    data = usb_iss_mocked.read_multi(device_address, list(range(0, 16, 2)), [2] * 8, address_bitlength=16)
+
+    assert data == [[0xAA, 0xBB]] * 8
+    assert mock_usb_iss.direct.call_count == 2
+
+
+@pytest.mark.parametrize("device_address", [0x30])
+def test_read_multi_split_read_length(mock_usb_iss, usb_iss_mocked, device_address):
+    mock_usb_iss.i2c = mock_usb_iss
+    mock_usb_iss.direct.side_effect = lambda message: [0x55] * (16 * list(message).count(defs.I2CDirect.STOP.value))
+
+    data = usb_iss_mocked.read_multi(device_address, list(range(0, 128, 16)), [16] * 8)
+
+    # The messages are short enough for 4 reads, but only 3 reads of 16 bytes fit in the 60 bytes read limit
+    assert data == [[0x55] * 16] * 8
+    assert mock_usb_iss.direct.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "device_address,word_addresses,byte_counts,address_bitlength,message",
+    [
+        (0x80, [0x10], [1], 8, r"^Invalid I2C address received: 0x80"),
+        (0x30, [0x10], [1, 2], 8, r"^The number of word addresses and byte counts must be the same"),
+        (0x30, [0x10], [1], 24, r"^Unknown bit size trying to be sent"),
+        (0x30, [0x10], [0], 8, r"^At least one byte must be read from each block"),
+        (0x30, [0x10], [17], 8, r"^USB ISS does not support a block read of more than 16 bytes"),
+    ],
+)
+def test_fail_read_multi(mock_usb_iss, usb_iss_mocked, device_address, word_addresses, byte_counts, address_bitlength, message):
+    mock_usb_iss.i2c = mock_usb_iss
+
+    with pytest.raises(Exception) as e_info:
+        usb_iss_mocked.read_multi(device_address, word_addresses, byte_counts, address_bitlength=address_bitlength)
+
+    assert e_info.match(message)
+    mock_usb_iss.direct.assert_not_called()
+
+
+@pytest.mark.parametrize("max_seq_byte", [None])
+@pytest.mark.parametrize("device_address", [0x30])
+def test_write_device_memory_split_at_usb_iss_limit(mock_usb_iss, usb_iss_mocked, device_address):
+    mock_usb_iss.i2c = mock_usb_iss
+
+    data = bytes(i & 0xFF for i in range(130))
+    usb_iss_mocked.write_device_memory(device_address, 0x1000, memoryview(data), address_bitlength=16, address_endianness='little')
+
+    max_bytes = usb_iss_mocked._max_write_byte_count
+    mock_usb_iss.write_ad2.assert_has_calls(
+        [
+            call(device_address, 0x0010, list(data[:max_bytes])),
+            call(device_address, 0x0010 | (max_bytes << 8), list(data[max_bytes : 2 * max_bytes])),
+            call(device_address, 0x0010 | ((2 * max_bytes) << 8), list(data[2 * max_bytes :])),
+        ]
+    )
+    assert mock_usb_iss.write_ad2.call_count == 3
+
+
+def test_read_multi_empty(mock_usb_iss, usb_iss_mocked):
+    mock_usb_iss.i2c = mock_usb_iss
+
+    assert usb_iss_mocked.read_multi(0x30, [], []) == []
+    mock_usb_iss.direct.assert_not_called()
+
+
+@pytest.mark.parametrize("device_address", [0x30])
+def test_async_gather_reads(mock_usb_iss, port, clock, device_address):
+    mock_usb_iss.read_module_id.return_value = 7
+    mock_usb_iss.i2c = mock_usb_iss
+    mock_usb_iss.direct.return_value = [0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08]
+
+    helper = AsyncUSB_ISS_Helper(port=port, clock=clock)
+
+    reads = [(0x0010, 1), (0x0011, 2), (0x0100, 1)]
+    words = asyncio.run(helper.gather_reads(device_address, reads, address_bitlength=16, address_endianness='little', word_bitlength=16))
+
+    assert words == [[0x0102], [0x0304, 0x0506], [0x0708]]
+    # The two contiguous reads are merged and both resulting reads are sent in a single direct message
+    mock_usb_iss.direct.assert_called_once()
+    message = list(mock_usb_iss.direct.call_args.args[0])
+    assert message.count(defs.I2CDirect.STOP.value) == 2
+    assert message[3:5] == [0x10, 0x00]
+
+
+@pytest.mark.parametrize("device_address", [0x30])
+def test_async_gather_reads_long(mock_usb_iss, port, clock, device_address):
+    mock_usb_iss.read_module_id.return_value = 7
+    mock_usb_iss.i2c = mock_usb_iss
+    messages = []
+
+    def direct(message):
+        messages.append(list(message))
+        # Each 8 byte read is a READ7 followed by the NACKed READ1
+        return [0x5A] * (8 * list(message).count(defs.I2CDirect.READ7.value))
+
+    mock_usb_iss.direct.side_effect = direct
+
+    helper = AsyncUSB_ISS_Helper(port=port, clock=clock, max_seq_byte=8)
+
+    words = asyncio.run(helper.gather_reads(device_address, [(0x00, 1000)], address_bitlength=16))
+
+    assert words == [[0x5A] * 1000]
+    # The range is split in 125 reads of max_seq_byte bytes, each taking 12 bytes of message, so 5 fit per message
+    assert len(messages) == 25
+    assert all(len(message) == 60 for message in messages)
+
+
+def test_async_gather_reads_wrong_endianness(mock_usb_iss, port, clock):
+    mock_usb_iss.read_module_id.return_value = 7
+    mock_usb_iss.i2c = mock_usb_iss
+
+    helper = AsyncUSB_ISS_Helper(port=port, clock=clock)
+
+    with pytest.raises(Exception) as e_info:
+        asyncio.run(helper.gather_reads(0x30, [(0x10, 1)], word_endianness='blabla'))
+    assert e_info.match(r"^A wrong word endianness was set: blabla")